@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+from mov_browser import create_driver
+from mov_fixture_server import start_fixture_server, render_static_site
+
+
+def process_tree_rss(pid):
+    """Sums VmRSS (bytes) over pid and all of its descendants, using /proc (Linux only)."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+    return total
+
+
+def measure_profile(url, lean, loads):
+    driver = create_driver(headless=True, lean=lean)
+    try:
+        timings = []
+        for _ in range(loads):
+            driver.get("about:blank")
+            start = time.perf_counter()
+            driver.get(url)
+            timings.append(time.perf_counter() - start)
+        rss = process_tree_rss(driver.service.process.pid)
+        return sum(timings) / len(timings), rss
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    # Compares the default Chrome profile with the lean one on a local static
+    # copy of a review page that also references posters, fonts, CSS and video.
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    server = start_fixture_server(pages=render_static_site(), latency=0.05)
+    url = f"http://127.0.0.1:{server.server_port}/static/reviews.html"
+
+    try:
+        default_time, default_rss = measure_profile(url, lean=False, loads=loads)
+        lean_time, lean_rss = measure_profile(url, lean=True, loads=loads)
+
+        print("\n" + "=" * 60)
+        print(f"{'BROWSER PROFILE BENCHMARK':^60}")
+        print("=" * 60)
+        print(f"Page loads per profile: {loads} (50 ms simulated latency per request)")
+        print(f"  - Default profile: {default_time * 1000:8.1f} ms/load, RSS {default_rss / 2**20:7.1f} MiB")
+        print(f"  - Lean profile:    {lean_time * 1000:8.1f} ms/load, RSS {lean_rss / 2**20:7.1f} MiB")
+        print(f"  - Speedup:         {default_time / lean_time:8.1f}x")
+        print("=" * 60)
+    finally:
+        server.shutdown()
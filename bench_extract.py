@@ -0,0 +1,80 @@
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from lxml import html
+
+from mov_extract import extract_titles, iter_file_chunks, iter_titles_streaming
+from mov_fixture_server import render_review_page
+
+
+def legacy_extract(path):
+    with open(path, "rb") as f:
+        tree = html.fromstring(f.read())
+    title_elements = tree.xpath("//article[contains(@class, 'user-review-item')]//h3")
+    if not title_elements:
+        title_elements = tree.xpath("//article//h3")
+    return [element.text_content().strip() for element in title_elements]
+
+
+def compiled_extract(path):
+    with open(path, "rb") as f:
+        return extract_titles(f.read())
+
+
+def streaming_extract(path):
+    return sum(1 for _ in iter_titles_streaming(iter_file_chunks(path)))
+
+
+MODES = {
+    "tree, XPath strings": legacy_extract,
+    "tree, compiled XPath": compiled_extract,
+    "streaming": streaming_extract,
+}
+
+
+def run_mode(name, paths, results):
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    count = 0
+    for path in paths:
+        found = MODES[name](path)
+        count += found if isinstance(found, int) else len(found)
+    elapsed = time.perf_counter() - start
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    results.put((name, count, elapsed, peak_kib))
+
+
+if __name__ == "__main__":
+    # Usage: python bench_extract.py [saved_page.html ...]
+    # Without arguments a synthetic 20,000-card review page is generated.
+    paths = sys.argv[1:]
+    tmp_dir = None
+    if not paths:
+        tmp_dir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmp_dir.name, "reviews.html")
+        with open(path, "wb") as f:
+            f.write(render_review_page("tt7817340", n_reviews=20000))
+        paths = [path]
+
+    total_mb = sum(os.path.getsize(path) for path in paths) / 2**20
+    results = multiprocessing.Queue()
+    print("\n" + "=" * 60)
+    print(f"{'REVIEW EXTRACTION BENCHMARK':^60}")
+    print("=" * 60)
+    print(f"Input: {len(paths)} page(s), {total_mb:.1f} MiB")
+    for name in MODES:
+        # Each mode runs in a fresh process so peak RSS is not shared between them.
+        process = multiprocessing.Process(target=run_mode, args=(name, paths, results))
+        process.start()
+        name, count, elapsed, peak_kib = results.get()
+        process.join()
+        print(f"  - {name:22s} {count:7d} titles {elapsed:7.3f} s "
+              f"{total_mb / elapsed:7.1f} MiB/s  peak +{peak_kib / 1024:6.1f} MiB")
+    print("=" * 60)
+
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
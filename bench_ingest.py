@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_vader import synthetic_reviews
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mov_nlp_v7.py")
+
+
+def run(args, stdin_path=None, stdout_path=os.devnull):
+    with open(stdin_path or os.devnull) as stdin, open(stdout_path, "w") as stdout:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SCRIPT, *args], stdin=stdin, stdout=stdout, stderr=subprocess.DEVNULL,
+                       check=True)
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    # Usage: python bench_ingest.py [reviews]
+    # One review per prompt (the export piped into --interactive, output to a
+    # file) vs. --ingest on the same export as plain text and as JSON Lines.
+    n_reviews = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    reviews = synthetic_reviews(n_reviews)
+    print("\n" + "=" * 60)
+    print(f"{'BULK INGESTION BENCHMARK':^60}")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        text_path = os.path.join(tmp_dir, "reviews.txt")
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(reviews) + "\nexit\n")
+        jsonl_path = os.path.join(tmp_dir, "reviews.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps({'review_id': f"rw{i:07d}", 'title': review}) + "\n"
+                         for i, review in enumerate(reviews))
+
+        prompt_log = os.path.join(tmp_dir, "interactive.log")
+        elapsed = run(["--interactive"], stdin_path=text_path, stdout_path=prompt_log)
+        baseline = n_reviews / elapsed
+        print(f"Reviews: {n_reviews:,}")
+        print(f"  - one review per prompt  {baseline:>9,.0f} reviews/s  "
+              f"({os.path.getsize(prompt_log) / 2**20:.1f} MiB printed)")
+
+        for label, source in (("text", text_path), ("JSONL", jsonl_path)):
+            output_path = os.path.join(tmp_dir, f"{label}.scored.jsonl")
+            elapsed = run(["--ingest", source, "--ingest-output", output_path])
+            with open(output_path, encoding="utf-8") as f:
+                rows = sum(1 for _ in f)
+            print(f"  - --ingest ({label:5s})       {rows / elapsed:>9,.0f} reviews/s  "
+                  f"speedup {rows / elapsed / baseline:4.1f}x, {os.path.getsize(output_path) / 2**20:.1f} MiB JSONL "
+                  f"at {os.path.getsize(output_path) / 2**20 / elapsed:.1f} MiB/s")
+    print("=" * 60)
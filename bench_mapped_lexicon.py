@@ -0,0 +1,86 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from mov_lexicon import ensure_mapped_lexicon, load_mapped_tables
+from mov_vader import VaderBatchScorer
+from bench_vader import synthetic_reviews
+
+MODES = ("analyzer", "marshal dict", "mapped")
+
+
+def memory_usage():
+    """Rss / Pss / private (USS) kB of this process from /proc/self/smaps_rollup (Linux only)."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {'rss': fields['Rss'], 'pss': fields['Pss'],
+            'private': fields['Private_Clean'] + fields['Private_Dirty']}
+
+
+def build_scorer(mode, mapped_path):
+    if mode == "analyzer":
+        # What each worker paid before: nltk plus its own parsed lexicon dict.
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+        return VaderBatchScorer(SentimentIntensityAnalyzer())
+    if mode == "marshal dict":
+        return VaderBatchScorer()
+    return VaderBatchScorer(tables=load_mapped_tables(mapped_path))
+
+
+def worker(mode, mapped_path, started, reports, release):
+    scorer = build_scorer(mode, mapped_path)
+    ready = time.time() - started
+    # Score a batch so the per-token cache and the lexicon pages it touches are counted.
+    scorer.score_many(synthetic_reviews(2000, seed=os.getpid()))
+    reports.put((ready, memory_usage()))
+    release.wait()
+
+
+def run_workers(mode, mapped_path, n_workers):
+    context = multiprocessing.get_context("spawn")
+    reports = context.Queue()
+    release = context.Event()
+    processes = [context.Process(target=worker, args=(mode, mapped_path, time.time(), reports, release))
+                 for _ in range(n_workers)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    # Every worker stays alive until all have reported, so shared pages are split between them.
+    results = [reports.get() for _ in processes]
+    all_ready = time.perf_counter() - start
+    release.set()
+    for process in processes:
+        process.join()
+    return results, all_ready
+
+
+if __name__ == "__main__":
+    # Usage: python bench_mapped_lexicon.py [worker_count]
+    # Workers are started with "spawn", so each one pays its own interpreter
+    # start and lexicon load, as it would on macOS/Windows or in a fresh
+    # service process; fork would share the parent's pages until written.
+    n_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    print("\n" + "=" * 60)
+    print(f"{'MAPPED LEXICON: PER-WORKER MEMORY AND SPAWN TIME':^60}")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mapped_path = ensure_mapped_lexicon(os.path.join(tmp_dir, "vader_lexicon.map"))
+        print(f"Workers: {n_workers}, mapped lexicon file {os.path.getsize(mapped_path) / 1024:.0f} KiB")
+        baseline = None
+        for mode in MODES:
+            # Spawn time from a lone worker (no CPU contention), memory with all n_workers alive.
+            spawn = min(run_workers(mode, mapped_path, 1)[0][0][0] for _ in range(3))
+            results, all_ready = run_workers(mode, mapped_path, n_workers)
+            memory = {key: sum(usage[key] for _, usage in results) / n_workers for key in ('rss', 'pss', 'private')}
+            baseline = baseline or memory
+            print(f"  - {mode:12s} spawn {spawn * 1e3:5.0f} ms ({n_workers} ready {all_ready * 1e3:5.0f} ms)  "
+                  f"RSS {memory['rss'] / 1024:5.1f} MiB  PSS {memory['pss'] / 1024:5.1f} MiB  "
+                  f"private {memory['private'] / 1024:5.1f} MiB  "
+                  f"(PSS saved vs analyzer {(baseline['pss'] - memory['pss']) / 1024:4.1f} MiB)")
+    print("=" * 60)
@@ -0,0 +1,65 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from mov_archive import PageArchive
+from mov_fixture_server import render_review_page
+from mov_pagestore import PageStore, zstandard
+
+
+def load_pages(paths):
+    pages = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            pages[f"file://{os.path.abspath(path)}"] = f.read()
+    return pages
+
+
+def synthetic_pages(n_pages):
+    rng = random.Random(42)
+    return {f"https://www.imdb.com/title/tt{i:07d}/reviews/": render_review_page(f"tt{i:07d}", rng.randint(5, 25))
+            for i in range(n_pages)}
+
+
+def measure(store, pages):
+    raw_mb = sum(len(body) for body in pages.values()) / 2**20
+    start = time.perf_counter()
+    for url, body in pages.items():
+        store.append(url, 200, {}, body, 0.0)
+    write_elapsed = time.perf_counter() - start
+
+    urls = list(pages)
+    random.Random(7).shuffle(urls)
+    start = time.perf_counter()
+    for url in urls:
+        assert store.get(url)[1] == pages[url]
+    read_elapsed = time.perf_counter() - start
+
+    stored = os.path.getsize(store.data_path)
+    return raw_mb * 2**20 / stored, raw_mb / write_elapsed, raw_mb / read_elapsed
+
+
+if __name__ == "__main__":
+    # Usage: python bench_pagestore.py [saved_page.html ...]
+    # Without arguments 2,000 synthetic review pages are generated.
+    pages = load_pages(sys.argv[1:]) if len(sys.argv) > 1 else synthetic_pages(2000)
+    samples = list(pages.values())[:max(10, len(pages) // 10)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stores = {"zlib, per page": PageArchive(os.path.join(tmp_dir, "plain"))}
+        stores["zlib + shared dict"] = PageStore(os.path.join(tmp_dir, "zlib"), samples=samples, codec="zlib")
+        if zstandard is not None:
+            stores["zstd + shared dict"] = PageStore(os.path.join(tmp_dir, "zstd"), samples=samples, codec="zstd")
+
+        raw_mb = sum(len(body) for body in pages.values()) / 2**20
+        print("\n" + "=" * 60)
+        print(f"{'PAGE STORE BENCHMARK':^60}")
+        print("=" * 60)
+        print(f"Pages: {len(pages)}, {raw_mb:.1f} MiB raw, dictionary trained on {len(samples)} pages")
+        for label, store in stores.items():
+            ratio, write_speed, read_speed = measure(store, pages)
+            print(f"  - {label:20s} ratio {ratio:6.1f}x  write {write_speed:7.1f} MiB/s  "
+                  f"random read {read_speed:7.1f} MiB/s")
+        print("=" * 60)
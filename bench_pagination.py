@@ -0,0 +1,43 @@
+import sys
+import time
+
+from mov_fixture_server import start_fixture_server
+from mov_nlp_v7 import scrape_all_titles_via_http, scrape_all_titles_with_see_all
+
+REVIEWS_PER_PAGE = 25
+
+if __name__ == "__main__":
+    # Compares HTTP pagination against the Selenium load-more loop on the local
+    # fixture site. Pass --browser to also drive Chrome (needs a local Chrome);
+    # the browser path waits on explicit conditions, so it has no fixed cost
+    # to estimate and is only reported when actually measured.
+    max_reviews = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 500
+    server = start_fixture_server(latency=0.05, reviews_per_page=REVIEWS_PER_PAGE, total_reviews=max_reviews)
+    url = f"http://127.0.0.1:{server.server_port}/title/tt7817340/reviews/"
+
+    try:
+        start = time.perf_counter()
+        titles = scrape_all_titles_via_http(url, max_reviews=max_reviews)
+        http_elapsed = time.perf_counter() - start
+        assert len(titles) == max_reviews, f"expected {max_reviews} titles, got {len(titles)}"
+
+        pages = -(-max_reviews // REVIEWS_PER_PAGE)
+        browser_elapsed = None
+        if "--browser" in sys.argv:
+            start = time.perf_counter()
+            scrape_all_titles_with_see_all(url, max_reviews=max_reviews)
+            browser_elapsed = time.perf_counter() - start
+
+        print("\n" + "=" * 60)
+        print(f"{'PAGINATION BENCHMARK':^60}")
+        print("=" * 60)
+        print(f"Reviews: {max_reviews} over {pages} pages (50 ms simulated latency)")
+        print(f"  - HTTP pagination:  {http_elapsed:8.2f} s")
+        if browser_elapsed is None:
+            print("  - Browser path:     not measured (pass --browser with a local Chrome)")
+        else:
+            print(f"  - Browser path:     {browser_elapsed:8.2f} s (explicit waits)")
+            print(f"  - Speedup:          {browser_elapsed / http_elapsed:8.1f}x")
+        print("=" * 60)
+    finally:
+        server.shutdown()
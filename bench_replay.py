@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import time
+
+from mov_extract import iter_titles_streaming
+from mov_fetch import fetch_stream
+from mov_archive import PageArchive, create_recording_session, create_replay_session
+from mov_fixture_server import start_fixture_server
+from mov_nlp_v6 import get_review_titles_for_many
+from mov_nlp_v7 import scrape_all_titles_via_http
+
+
+def run_pipeline(session, base_url, title_ids):
+    start = time.perf_counter()
+    titles_by_id = get_review_titles_for_many(title_ids, base_url=base_url, report=False, session=session)
+    paginated = scrape_all_titles_via_http(f"{base_url}/title/tt7817340/reviews/", max_reviews=500, session=session)
+    # The --stream path (mov_nlp_v6.py --stream --replay PATH) reads the body incrementally.
+    streamed = list(iter_titles_streaming(fetch_stream(f"{base_url}/title/tt7817340/reviews/", session=session)))
+    return time.perf_counter() - start, titles_by_id, paginated, streamed
+
+
+if __name__ == "__main__":
+    # Usage: python bench_replay.py [archive_path]
+    # Records the bulk and paginated scraping paths against the local fixture
+    # server once, then replays them offline at full speed and at recorded latency.
+    n_titles = 200
+    title_ids = [f"tt{i:07d}" for i in range(n_titles)]
+    tmp_dir = None
+    if len(sys.argv) > 1:
+        archive_path = sys.argv[1]
+    else:
+        tmp_dir = tempfile.TemporaryDirectory()
+        archive_path = os.path.join(tmp_dir.name, "pages")
+
+    archive = PageArchive(archive_path)
+    server = start_fixture_server(latency=0.02, total_reviews=500)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        live_elapsed, live_titles, live_paginated, live_streamed = run_pipeline(create_recording_session(archive), base_url, title_ids)
+    finally:
+        server.shutdown()
+
+    # The fixture server is gone now; everything below is served from the archive.
+    replay = {}
+    for label, latency in (("replay, full speed", None), ("replay, recorded latency", "recorded")):
+        elapsed, titles, paginated, streamed = run_pipeline(create_replay_session(archive, latency), base_url, title_ids)
+        assert titles == live_titles and paginated == live_paginated, "replay diverged from the recording"
+        assert streamed and streamed == live_streamed, "streamed replay diverged from the recording"
+        replay[label] = elapsed
+
+    stats = archive.stats()
+    pages = stats['urls']
+    print("\n" + "=" * 60)
+    print(f"{'RECORD / REPLAY BENCHMARK':^60}")
+    print("=" * 60)
+    print(f"Archive: {pages} pages, {stats['raw_bytes'] / 2**20:.1f} MiB raw, "
+          f"{stats['stored_bytes'] / 2**20:.2f} MiB stored")
+    print(f"  - {'live + record':26s} {live_elapsed:7.2f} s {pages / live_elapsed:9.1f} pages/s")
+    for label, elapsed in replay.items():
+        print(f"  - {label:26s} {elapsed:7.2f} s {pages / elapsed:9.1f} pages/s")
+    print("=" * 60)
+
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
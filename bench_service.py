@@ -0,0 +1,108 @@
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+
+from bench_vader import synthetic_reviews
+from mov_cli import flag_value, port_number
+from mov_service import DEFAULT_HOST, percentile
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {DEFAULT_HOST}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(port, texts, latencies, deadline):
+    reader, writer = await asyncio.open_connection(DEFAULT_HOST, port)
+    try:
+        for text in texts:
+            if time.perf_counter() > deadline:
+                break
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, "POST", "/score", {'text': text})
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def generate_load(port, concurrency, requests_per_client, duration):
+    """`concurrency` keep-alive clients each sending single-review requests back to back."""
+    reviews = synthetic_reviews(concurrency * requests_per_client)
+    latencies = []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, reviews[i::concurrency], latencies, deadline) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection(DEFAULT_HOST, port)
+    _, stats = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    return latencies, elapsed, stats
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((DEFAULT_HOST, 0))
+        return sock.getsockname()[1]
+
+
+def start_service(max_batch_size, max_wait_ms):
+    port = free_port()
+    process = subprocess.Popen([sys.executable, "mov_service.py", "--port", str(port), "--max-batch",
+                                str(max_batch_size), "--max-wait-ms", str(max_wait_ms)], stdout=subprocess.DEVNULL)
+    for _ in range(200):
+        try:
+            socket.create_connection((DEFAULT_HOST, port), timeout=0.1).close()
+            return process, port
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("scoring service did not start")
+
+
+def print_run(label, latencies, elapsed, stats):
+    latencies.sort()
+    print(f"{label}: {len(latencies) / elapsed:>8,.0f} req/s  client latency p50 {percentile(latencies, 0.5) * 1e3:6.2f}"
+          f"  p90 {percentile(latencies, 0.9) * 1e3:6.2f}  p99 {percentile(latencies, 0.99) * 1e3:6.2f} ms")
+    print(f"    server: {stats['latency_ms']} ms, mean batch {stats['mean_batch_size']}, "
+          f"batches {stats['batch_size_histogram']}")
+
+
+if __name__ == "__main__":
+    # Usage: python bench_service.py [concurrency] [--port PORT]
+    # Without --port, starts mov_service.py once without batching (max batch 1)
+    # and once with micro-batching, on a free local port, and loads both.
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 64
+    requests_per_client, duration = 200, 10.0
+    print("\n" + "=" * 60)
+    print(f"{'SCORING SERVICE LOAD TEST':^60}")
+    print("=" * 60)
+    print(f"{concurrency} keep-alive clients, up to {requests_per_client} single-review requests each")
+    if "--port" in sys.argv:
+        port = flag_value(sys.argv, "--port", port_number,
+                          usage="Usage: python bench_service.py [concurrency] [--port PORT]")
+        print_run(f"localhost:{port}", *asyncio.run(generate_load(port, concurrency, requests_per_client, duration)))
+    else:
+        for label, max_batch_size, max_wait_ms in (("no batching  ", 1, 0), ("micro-batched", 64, 2)):
+            process, port = start_service(max_batch_size, max_wait_ms)
+            try:
+                print_run(label, *asyncio.run(generate_load(port, concurrency, requests_per_client, duration)))
+            finally:
+                process.terminate()
+                process.wait()
+    print("=" * 60)
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from mov_lexicon import DEFAULT_LEXICON_CACHE_PATH
+
+# What mov_nlp_v7 paid at startup before imports were deferred: the whole
+# scraping stack plus nltk, and the VADER lexicon parsed from its zip.
+EAGER_START = """
+import nltk, requests, lxml.html, lxml.etree
+import selenium.webdriver, webdriver_manager.chrome
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+from mov_vader import VaderBatchScorer
+VaderBatchScorer(SentimentIntensityAnalyzer())
+"""
+FAST_START = "import mov_nlp_v7; from mov_vader import VaderBatchScorer; VaderBatchScorer()"
+HEAVY_MODULES = ("nltk", "selenium", "webdriver_manager", "lxml", "requests")
+
+
+def import_times(code):
+    """Cumulative microseconds per top-level package from `python -X importtime`."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True)
+    totals = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            # Nested imports are already counted in their parent's cumulative time.
+            continue
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0) + int(cumulative)
+    return totals
+
+
+def wall_time(args, stdin=None, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], input=stdin, capture_output=True, text=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print(f"{'STARTUP TIME BENCHMARK':^60}")
+    print("=" * 60)
+    for label, code in (("eager imports", EAGER_START), ("fast start", FAST_START)):
+        totals = import_times(code)
+        heavy = {name: totals.get(name, 0) for name in HEAVY_MODULES}
+        print(f"{label}: {sum(totals.values()) / 1e3:7.1f} ms importing")
+        for name, micros in sorted(totals.items(), key=lambda item: -item[1])[:5]:
+            print(f"  - {name:20s} {micros / 1e3:7.1f} ms")
+        print(f"  heavy modules loaded: {[name for name, micros in heavy.items() if micros] or 'none'}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "lexicon.marshal")
+        build = f"from mov_lexicon import load_vader_tables; load_vader_tables({cache_path!r})"
+        cold = wall_time(["-c", build], repeat=1)
+        warm = wall_time(["-c", build])
+    print(f"lexicon: first run (parse zip, write cache) {cold * 1e3:6.1f} ms, cached load {warm * 1e3:6.1f} ms")
+
+    if not os.path.exists(DEFAULT_LEXICON_CACHE_PATH):
+        wall_time(["-c", "from mov_lexicon import load_vader_tables; load_vader_tables()"], repeat=1)
+    eager = wall_time(["-c", EAGER_START])
+    fast = wall_time(["mov_nlp_v7.py", "--interactive"], stdin="exit\n")
+    print(f"process start to first prompt: eager {eager * 1e3:6.1f} ms, "
+          f"mov_nlp_v7.py --interactive {fast * 1e3:6.1f} ms ({eager / fast:.1f}x)")
+    print("=" * 60)
@@ -0,0 +1,61 @@
+import random
+import sys
+import time
+
+from mov_vader import VaderBatchScorer, SCORE_DTYPE
+
+REVIEW_WORDS = ("the movie film plot acting story ending cast director scenes music script characters "
+                "was is were it this that and with a of to in for but not never very really so too "
+                "great good amazing brilliant masterpiece fun enjoyable beautiful solid decent "
+                "bad boring awful terrible mess disappointing weak dull predictable slow "
+                "kind of at least extremely barely hardly isn't didn't can't no").split()
+ENDINGS = ("", "", "", ".", "!", "!!", "?", "...", "!?")
+
+
+def synthetic_reviews(n_reviews, seed=42):
+    """Review-title-like texts: 3-14 words, occasional ALL CAPS and trailing punctuation."""
+    rng = random.Random(seed)
+    reviews = []
+    for _ in range(n_reviews):
+        words = rng.choices(REVIEW_WORDS, k=rng.randint(3, 14))
+        if rng.random() < 0.1:
+            index = rng.randrange(len(words))
+            words[index] = words[index].upper()
+        reviews.append(" ".join(words).capitalize() + rng.choice(ENDINGS))
+    return reviews
+
+
+def baseline_scores(sid, texts):
+    results = [sid.polarity_scores(text) for text in texts]
+    return [tuple(scores[name] for name in SCORE_DTYPE.names) for scores in results]
+
+
+if __name__ == "__main__":
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+    # Usage: python bench_vader.py [max_reviews]
+    # The polarity_scores baseline is only run up to 100k reviews.
+    max_reviews = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sizes = [size for size in (10_000, 100_000, 1_000_000) if size <= max_reviews]
+    sid = SentimentIntensityAnalyzer()
+
+    print("\n" + "=" * 60)
+    print(f"{'VADER BATCH SCORING BENCHMARK':^60}")
+    print("=" * 60)
+    for size in sizes:
+        reviews = synthetic_reviews(size)
+        scorer = VaderBatchScorer(sid)
+        start = time.perf_counter()
+        scores = scorer.score_many(reviews)
+        batch_elapsed = time.perf_counter() - start
+        print(f"{size:>9,} reviews ({len(set(reviews)):,} distinct)")
+        print(f"  - score_many       {size / batch_elapsed:>10,.0f} reviews/s")
+
+        if size <= 100_000:
+            start = time.perf_counter()
+            expected = baseline_scores(sid, reviews)
+            baseline_elapsed = time.perf_counter() - start
+            identical = expected == scores.tolist()
+            print(f"  - polarity_scores  {size / baseline_elapsed:>10,.0f} reviews/s  "
+                  f"speedup {baseline_elapsed / batch_elapsed:.1f}x, identical: {identical}")
+    print("=" * 60)
@@ -0,0 +1,161 @@
+import io
+import json
+import os
+import threading
+import time
+import zlib
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from mov_cli import flag_value
+from mov_fetch import DEFAULT_HEADERS
+
+
+class PageArchive:
+    """
+    Append-only archive of fetched responses for offline record/replay.
+
+    Bodies are zlib-compressed one record at a time and appended to
+    `<path>.data`; `<path>.idx` holds one JSON line per record with its URL,
+    byte offset, status, headers and the latency observed when recording.
+    A URL recorded more than once resolves to its latest record.
+    """
+
+    def __init__(self, path):
+        self.data_path = path + ".data"
+        self.index_path = path + ".idx"
+        self.lock = threading.Lock()
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.index[entry['url']] = entry
+
+    def compress(self, body):
+        return zlib.compress(body, 6)
+
+    def decompress(self, blob):
+        return zlib.decompress(blob)
+
+    def append(self, url, status, headers, body, elapsed):
+        compressed = self.compress(body)
+        with self.lock:
+            with open(self.data_path, "ab") as data:
+                offset = data.seek(0, os.SEEK_END)
+                data.write(compressed)
+            entry = {'url': url, 'offset': offset, 'length': len(compressed), 'size': len(body),
+                     'status': status, 'headers': headers, 'elapsed': elapsed, 'recorded_at': time.time()}
+            with open(self.index_path, "a", encoding="utf-8") as index:
+                index.write(json.dumps(entry) + "\n")
+            self.index[url] = entry
+        return entry
+
+    def get(self, url):
+        """Returns (entry, body) for the latest record of `url`, or None."""
+        entry = self.index.get(url)
+        if entry is None:
+            return None
+        with open(self.data_path, "rb") as data:
+            data.seek(entry['offset'])
+            return entry, self.decompress(data.read(entry['length']))
+
+    def urls(self):
+        return list(self.index)
+
+    def stats(self):
+        stored = os.path.getsize(self.data_path) if os.path.exists(self.data_path) else 0
+        raw = sum(entry['size'] for entry in self.index.values())
+        return {'urls': len(self.index), 'raw_bytes': raw, 'stored_bytes': stored}
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTPAdapter that also appends every non-304 response it receives to a PageArchive."""
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        body = response.content
+        if response.status_code != 304:
+            self.archive.append(request.url, response.status_code, dict(response.headers), body,
+                                time.perf_counter() - start)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter that serves responses from a PageArchive without touching
+    the network. latency=None replays at full speed, a number adds that many
+    seconds per request, and 'recorded' sleeps for each record's original latency.
+    """
+
+    def __init__(self, archive, latency=None):
+        super().__init__()
+        self.archive = archive
+        self.latency = latency
+        self.served = 0
+        self.missing = 0
+
+    def send(self, request, **kwargs):
+        record = self.archive.get(request.url)
+        if record is None:
+            self.missing += 1
+            raise requests.exceptions.ConnectionError(f"{request.url} is not in the replay archive", request=request)
+        entry, body = record
+
+        delay = entry['elapsed'] if self.latency == 'recorded' else self.latency
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.headers.pop('Content-Encoding', None)
+        # A file-like raw body, so stream=True / iter_content work like a live response.
+        response.raw = io.BytesIO(body)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.reason = "Replayed"
+        self.served += 1
+        return response
+
+    def close(self):
+        pass
+
+
+def create_recording_session(archive, pool_size=10):
+    """Keep-alive session that records every response into `archive`."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = RecordingAdapter(archive, pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def create_replay_session(archive, latency=None):
+    """Session whose requests are all answered from `archive`."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = ReplayAdapter(archive, latency=latency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def session_from_argv(argv):
+    """Returns a recording or replay session for `--record PATH` / `--replay PATH` on the command line, else None."""
+    for flag, factory in (("--record", create_recording_session), ("--replay", create_replay_session)):
+        path = flag_value(argv, flag, usage="Usage: --record PATH | --replay PATH")
+        if path is not None:
+            return factory(PageArchive(path))
+    return None
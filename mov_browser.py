@@ -0,0 +1,151 @@
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+# URL patterns blocked by the lean profile through CDP request interception.
+LEAN_BLOCKED_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.m3u8",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.css",
+]
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def get_driver_path():
+    """Resolves the chromedriver binary once per process instead of once per browser."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def create_driver(headless=False, lean=False, network_log=False):
+    """
+    Starts a Chrome instance with the scraper's default options.
+    lean=True implies headless, uses the 'eager' page-load strategy (return at
+    DOMContentLoaded) and blocks images, media, fonts and stylesheets, none of
+    which the title extraction reads.
+    network_log=True records CDP Network events in the 'performance' log.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument('--log-level=3')
+    if network_log:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    if headless or lean:
+        options.add_argument('--headless=new')
+    if lean:
+        options.page_load_strategy = 'eager'
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+        })
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--mute-audio')
+
+    driver = webdriver.Chrome(service=Service(get_driver_path()), options=options)
+    if lean:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+    return driver
+
+
+def reset_driver(driver):
+    """Clears cookies and web storage and navigates away so the next title starts clean."""
+    driver.delete_all_cookies()
+    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    driver.get("about:blank")
+
+
+class BrowserPool:
+    """
+    Pool of long-lived headless Chrome workers.
+
+    At most `size` drivers are checked out at once. Drivers are reset between
+    titles and quit after `max_uses` checkouts (or after an error) to bound the
+    memory a long-running Chrome accumulates.
+    """
+
+    def __init__(self, size=4, max_uses=20, driver_factory=None, lean=False, network_log=False):
+        self.size = size
+        self.max_uses = max_uses
+        self.driver_factory = driver_factory or (
+            lambda: create_driver(headless=True, lean=lean, network_log=network_log))
+        self.idle = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(size)
+        self.uses = {}
+        self.lock = threading.Lock()
+        self.started = 0
+        self.recycled = 0
+
+    @contextmanager
+    def checkout(self):
+        self.slots.acquire()
+        try:
+            try:
+                driver = self.idle.get_nowait()
+            except queue.Empty:
+                driver = self.driver_factory()
+                with self.lock:
+                    self.started += 1
+                    self.uses[id(driver)] = 0
+        except Exception:
+            self.slots.release()
+            raise
+
+        healthy = False
+        try:
+            yield driver
+            healthy = True
+        finally:
+            self._checkin(driver, healthy)
+            self.slots.release()
+
+    def _checkin(self, driver, healthy):
+        with self.lock:
+            self.uses[id(driver)] += 1
+            worn_out = self.uses[id(driver)] >= self.max_uses
+        if healthy and not worn_out:
+            try:
+                reset_driver(driver)
+                self.idle.put(driver)
+                return
+            except Exception as e:
+                print(f"Browser reset failed, recycling worker: {e}", file=sys.stderr)
+        self._quit(driver)
+        with self.lock:
+            self.recycled += 1
+
+    def _quit(self, driver):
+        with self.lock:
+            self.uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def stats(self):
+        with self.lock:
+            return {'size': self.size, 'idle': self.idle.qsize(), 'started': self.started,
+                    'recycled': self.recycled}
+
+    def close(self):
+        while True:
+            try:
+                self._quit(self.idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,45 @@
+import sys
+
+
+def flag_value(argv, flag, convert=str, default=None, usage=None):
+    """
+    Returns the argument after `flag` in argv passed through `convert`, or
+    `default` when the flag is absent. A missing value, or one that `convert`
+    rejects with ValueError, is reported on stderr together with `usage`, and
+    the program exits with status 2 instead of raising IndexError/ValueError.
+    """
+    if flag not in argv:
+        return default
+    position = argv.index(flag) + 1
+    value = argv[position] if position < len(argv) else None
+    try:
+        if value is None or value.startswith("--"):
+            raise ValueError("missing value")
+        return convert(value)
+    except ValueError as err:
+        print(f"❌ {flag}: {err}", file=sys.stderr)
+        if usage:
+            print(usage, file=sys.stderr)
+        sys.exit(2)
+
+
+def positive_int(value):
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"expected a positive integer, got {value!r}")
+    return int(value)
+
+
+def port_number(value):
+    if not value.isdigit() or int(value) > 65535:
+        raise ValueError(f"expected a port number (0-65535), got {value!r}")
+    return int(value)
+
+
+def non_negative_float(value):
+    try:
+        number = float(value)
+    except ValueError:
+        number = -1.0
+    if not number >= 0 or number == float("inf"):
+        raise ValueError(f"expected a number >= 0, got {value!r}")
+    return number
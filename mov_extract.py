@@ -0,0 +1,109 @@
+import re
+from datetime import datetime
+
+from lxml import etree, html
+
+# Selector chain compiled once at import instead of on every page.
+REVIEW_TITLE_SELECTOR = etree.XPath("//article[contains(@class, 'user-review-item')]//h3")
+FALLBACK_TITLE_SELECTOR = etree.XPath("//article//h3")
+CARD_TITLE_SELECTOR = etree.XPath(".//h3")
+REVIEW_CARD_SELECTOR = etree.XPath("//article[contains(@class, 'user-review-item')]")
+CARD_LINK_SELECTOR = etree.XPath(".//a[contains(@href, '/review/rw')]/@href")
+CARD_DATE_SELECTOR = etree.XPath(".//*[contains(@class, 'review-date')]")
+
+REVIEW_ID_RE = re.compile(r'rw\d+')
+REVIEW_DATE_FORMATS = ("%d %B %Y", "%d %b %Y", "%b %d, %Y", "%B %d, %Y", "%Y-%m-%d")
+
+REVIEW_CARD_CLASS = "user-review-item"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def extract_titles(content, verbose=False):
+    """Parses a whole review page and returns its review titles (class-based query, then generic fallback)."""
+    tree = html.fromstring(content)
+    title_elements = REVIEW_TITLE_SELECTOR(tree)
+
+    if not title_elements:
+        title_elements = FALLBACK_TITLE_SELECTOR(tree)
+        if verbose:
+            if title_elements:
+                print("    (Using fallback generic XPath query.)")
+            else:
+                print("    Warning: No title elements found.")
+
+    return [element.text_content().strip() for element in title_elements]
+
+
+def parse_review_date(text):
+    """Parses an IMDb review date such as '9 March 2024' or 'Mar 9, 2024' into 'YYYY-MM-DD', or None."""
+    text = " ".join(text.split())
+    for date_format in REVIEW_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def extract_review_cards(tree):
+    """Returns one {'review_id', 'title', 'date'} dict per review card in a parsed page."""
+    cards = []
+    for card in REVIEW_CARD_SELECTOR(tree):
+        review_id = card.get("data-review-id")
+        if not review_id:
+            links = CARD_LINK_SELECTOR(card)
+            match = REVIEW_ID_RE.search(links[0]) if links else None
+            review_id = match.group(0) if match else None
+        headings = CARD_TITLE_SELECTOR(card)
+        dates = CARD_DATE_SELECTOR(card)
+        cards.append({
+            'review_id': review_id,
+            'title': headings[0].text_content().strip() if headings else None,
+            'date': parse_review_date(dates[0].text_content()) if dates else None,
+        })
+    return cards
+
+
+def iter_titles_streaming(chunks):
+    """
+    Event-driven variant of extract_titles over an iterable of byte chunks.
+
+    Titles are yielded as each <article> closes, and the article (plus any
+    already-processed siblings) is cleared, so memory stays bounded by one
+    card rather than the whole page. Generic <article> titles are only held
+    back until the first review-item card shows up; if none ever does they
+    are emitted at the end, matching the fallback of extract_titles.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="article")
+    parser.set_element_class_lookup(html.HtmlElementClassLookup())
+    fallback_titles = []
+    found_review_cards = False
+
+    def drain():
+        nonlocal found_review_cards
+        for _, element in parser.read_events():
+            titles = [heading.text_content().strip() for heading in CARD_TITLE_SELECTOR(element)]
+            if REVIEW_CARD_CLASS in (element.get("class") or ""):
+                found_review_cards = True
+                fallback_titles.clear()
+                yield from titles
+            elif not found_review_cards:
+                fallback_titles.extend(titles)
+
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+    if not found_review_cards:
+        yield from fallback_titles
+
+
+def iter_file_chunks(path, chunk_size=STREAM_CHUNK_SIZE):
+    with open(path, "rb") as f:
+        yield from iter(lambda: f.read(chunk_size), b"")
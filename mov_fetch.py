@@ -0,0 +1,457 @@
+import json
+import random
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+IMDB_BASE_URL = "https://www.imdb.com"
+REVIEWS_PATH = "/title/{title_id}/reviews/"
+DEFAULT_CACHE_PATH = ".http_cache.sqlite"
+
+
+def create_session(pool_size=10):
+    """Creates a keep-alive session whose connection pool can serve `pool_size` threads at once."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def review_url(title_id, base_url=IMDB_BASE_URL):
+    """Builds the review page URL for an IMDb title ID such as 'tt7817340'."""
+    return base_url.rstrip("/") + REVIEWS_PATH.format(title_id=title_id)
+
+
+class ResponseCache:
+    """
+    Persistent on-disk HTTP response cache keyed by URL (SQLite-backed).
+
+    Entries younger than `ttl` seconds are served without touching the network.
+    Older entries are revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged page only costs a 304. The total stored body size is bounded by
+    `max_bytes`; the least recently used entries are evicted first.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=3600, max_bytes=200 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB,"
+            " etag TEXT, last_modified TEXT, stored_at REAL, last_access REAL, size INTEGER)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)")
+        self.conn.commit()
+
+    def get(self, url):
+        """Returns the cached entry for `url` as a dict, or None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, etag, last_modified, stored_at = row
+        return {
+            'url': url, 'status': status, 'headers': json.loads(headers), 'body': body,
+            'etag': etag, 'last_modified': last_modified, 'stored_at': stored_at,
+        }
+
+    def record(self, counter):
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def is_fresh(self, entry):
+        return time.time() - entry['stored_at'] < self.ttl
+
+    def put(self, url, response):
+        """Stores a 200 response and evicts LRU entries beyond max_bytes."""
+        now = time.time()
+        body = response.content
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, json.dumps(dict(response.headers)), body,
+                 response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 now, now, len(body)),
+            )
+            self._evict()
+            self.conn.commit()
+
+    def touch(self, url, refresh=False):
+        """Marks `url` as recently used; refresh=True also restarts its TTL (after a 304)."""
+        now = time.time()
+        with self.lock:
+            if refresh:
+                self.conn.execute(
+                    "UPDATE responses SET last_access = ?, stored_at = ? WHERE url = ?", (now, now, url))
+            else:
+                self.conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, url))
+            self.conn.commit()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self.conn.execute(
+                "SELECT url, size FROM responses ORDER BY last_access").fetchall():
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self):
+        with self.lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'revalidated': self.revalidated,
+                'entries': entries, 'bytes': size}
+
+    def close(self):
+        self.conn.close()
+
+
+def response_from_cache(entry):
+    """Rebuilds a requests.Response from a cache entry."""
+    response = requests.Response()
+    response.url = entry['url']
+    response.status_code = entry['status']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response._content = entry['body']
+    response.from_cache = True
+    return response
+
+
+class RateLimiter:
+    """
+    Thread-safe adaptive token-bucket limiter shared by all fetches.
+
+    Each host gets its own bucket (`rate` requests/second, up to `burst` at once)
+    and at most `max_concurrency` requests in flight. A 429 halves that host's
+    rate (down to `min_rate`) and each success adds `recovery` back, up to
+    `max_rate`. Retry-After and backoff delays block the whole host; a
+    Retry-After longer than `max_retry_after` seconds is cut to that.
+    """
+
+    def __init__(self, rate=5.0, burst=5, max_concurrency=4, min_rate=0.5, max_rate=None,
+                 recovery=0.5, max_retries=5, backoff_base=0.5, backoff_cap=30.0, max_retry_after=120.0):
+        self.initial_rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.recovery = recovery
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_retry_after = max_retry_after
+        self.lock = threading.Lock()
+        self.hosts = {}
+        self.metrics = {'requests': 0, 'retries': 0, 'responses_429': 0, 'responses_5xx': 0,
+                        'connection_errors': 0, 'throttled_seconds': 0.0, 'backoff_seconds': 0.0}
+
+    def _host(self, host):
+        state = self.hosts.get(host)
+        if state is None:
+            state = {'rate': self.initial_rate, 'tokens': float(self.burst), 'updated': time.monotonic(),
+                     'blocked_until': 0.0, 'slots': threading.BoundedSemaphore(self.max_concurrency)}
+            self.hosts[host] = state
+        return state
+
+    def acquire(self, host):
+        """Blocks until `host` has a free concurrency slot and a token; returns the time spent waiting."""
+        with self.lock:
+            slots = self._host(host)['slots']
+        start = time.monotonic()
+        slots.acquire()
+        while True:
+            with self.lock:
+                state = self._host(host)
+                now = time.monotonic()
+                state['tokens'] = min(self.burst, state['tokens'] + (now - state['updated']) * state['rate'])
+                state['updated'] = now
+                if now >= state['blocked_until'] and state['tokens'] >= 1:
+                    state['tokens'] -= 1
+                    waited = now - start
+                    self.metrics['requests'] += 1
+                    self.metrics['throttled_seconds'] += waited
+                    return waited
+                delay = max(state['blocked_until'] - now, (1 - state['tokens']) / state['rate'])
+            time.sleep(delay)
+
+    def release(self, host):
+        with self.lock:
+            slots = self._host(host)['slots']
+        slots.release()
+
+    def record_success(self, host):
+        with self.lock:
+            state = self._host(host)
+            state['rate'] = min(self.max_rate, state['rate'] + self.recovery)
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Retry-After (capped at max_retry_after) when the server sent one, else full-jitter exponential backoff."""
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def record_failure(self, host, status, delay):
+        """Records a 429/5xx (status None: connection error) and blocks the host for `delay` seconds."""
+        with self.lock:
+            state = self._host(host)
+            if status == 429:
+                self.metrics['responses_429'] += 1
+                state['rate'] = max(self.min_rate, state['rate'] / 2)
+            elif status is None:
+                self.metrics['connection_errors'] += 1
+            else:
+                self.metrics['responses_5xx'] += 1
+            self.metrics['retries'] += 1
+            self.metrics['backoff_seconds'] += delay
+            state['blocked_until'] = max(state['blocked_until'], time.monotonic() + delay)
+            state['tokens'] = min(state['tokens'], 0.0)
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.metrics)
+            stats['rates'] = {host: round(state['rate'], 2) for host, state in self.hosts.items()}
+        return stats
+
+
+def parse_retry_after(value):
+    """Parses a Retry-After header given as seconds or an HTTP date; returns seconds or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def send(url, session=None, headers=None, timeout=10, limiter=None):
+    """
+    Issues one GET, going through `limiter` when given: waits for a token and a
+    per-host slot, and retries 429/5xx responses and connection errors with
+    Retry-After or jittered exponential backoff. Returns the final response.
+    """
+    headers = headers or {}
+    if limiter is None:
+        if session is None:
+            return requests.get(url, headers={**DEFAULT_HEADERS, **headers}, timeout=timeout)
+        return session.get(url, headers=headers, timeout=timeout)
+
+    host = urlsplit(url).netloc
+    attempt = 0
+    while True:
+        limiter.acquire(host)
+        try:
+            response = send(url, session=session, headers=headers, timeout=timeout)
+        except requests.exceptions.ConnectionError:
+            if attempt >= limiter.max_retries:
+                raise
+            response = None
+        finally:
+            limiter.release(host)
+
+        status = response.status_code if response is not None else None
+        if status is not None and status != 429 and status < 500:
+            limiter.record_success(host)
+            return response
+        if attempt >= limiter.max_retries:
+            return response
+
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        delay = limiter.backoff_delay(attempt, retry_after)
+        limiter.record_failure(host, status, delay)
+        if response is not None:
+            response.close()
+        attempt += 1
+
+
+def fetch(url, session=None, timeout=10, cache=None, limiter=None):
+    """
+    Fetches a single URL and returns (response, elapsed_seconds).
+    With a ResponseCache, fresh entries skip the network and stale ones are
+    revalidated with a conditional GET. With a RateLimiter, requests are
+    paced per host and throttled/5xx responses are retried.
+    Raises requests.exceptions.RequestException on network or HTTP errors.
+    """
+    start = time.perf_counter()
+    entry = cache.get(url) if cache is not None else None
+    if entry is not None and cache.is_fresh(entry):
+        cache.record('hits')
+        cache.touch(url)
+        return response_from_cache(entry), time.perf_counter() - start
+
+    headers = {}
+    if entry is not None:
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = send(url, session=session, headers=headers, timeout=timeout, limiter=limiter)
+
+    if entry is not None and response.status_code == 304:
+        cache.record('revalidated')
+        cache.touch(url, refresh=True)
+        return response_from_cache(entry), time.perf_counter() - start
+
+    response.raise_for_status()
+    if cache is not None:
+        cache.record('misses')
+        cache.put(url, response)
+    return response, time.perf_counter() - start
+
+
+def fetch_stream(url, session=None, timeout=10, chunk_size=64 * 1024):
+    """
+    Fetches a URL without buffering the whole body and yields it in byte chunks.
+    Raises requests.exceptions.RequestException on network or HTTP errors.
+    """
+    if session is None:
+        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout, stream=True)
+    else:
+        response = session.get(url, timeout=timeout, stream=True)
+    with response:
+        response.raise_for_status()
+        yield from response.iter_content(chunk_size=chunk_size)
+
+
+def fetch_many(urls, parse=None, max_workers=8, session=None, timeout=10, cache=None, limiter=None):
+    """
+    Fetches many URLs concurrently over one shared keep-alive session.
+
+    Returns one dict per URL, in input order, with keys
+    'url', 'status', 'elapsed', 'result' and 'error'. 'elapsed' is the
+    per-URL latency in seconds; 'result' is parse(response) or the raw bytes.
+    """
+    urls = list(urls)
+    own_session = session is None
+    if own_session:
+        session = create_session(pool_size=max_workers)
+
+    def task(url):
+        start = time.perf_counter()
+        item = {'url': url, 'status': None, 'elapsed': 0.0, 'result': None, 'error': None}
+        try:
+            response, _ = fetch(url, session=session, timeout=timeout, cache=cache, limiter=limiter)
+            item['status'] = response.status_code
+            item['result'] = parse(response) if parse else response.content
+        except requests.exceptions.RequestException as err:
+            item['status'] = getattr(err.response, 'status_code', None)
+            item['error'] = err
+        except Exception as e:
+            item['error'] = e
+        item['elapsed'] = time.perf_counter() - start
+        return item
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(task, urls))
+    finally:
+        if own_session:
+            session.close()
+
+
+def print_latency_report(results, title="FETCH LATENCY REPORT"):
+    """Prints per-URL latency plus total throughput for a fetch_many() result list."""
+    if not results:
+        print(f"\n[ {title} ]")
+        print("No URLs fetched.")
+        return
+
+    latencies = sorted(item['elapsed'] for item in results)
+    failed = sum(1 for item in results if item['error'] is not None)
+
+    print("\n" + "=" * 60)
+    print(f"{title:^60}")
+    print("=" * 60)
+    for item in results:
+        status = item['status'] if item['error'] is None else f"ERR {item['status']}"
+        print(f"  {item['elapsed'] * 1000:8.1f} ms  [{status}]  {item['url']}")
+    print("-" * 60)
+    print(f"URLs: {len(results)}  (failed: {failed})")
+    print(f"Latency p50: {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"max: {latencies[-1] * 1000:.1f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    # Offline throughput benchmark against the local fixture server.
+    from mov_fixture_server import start_fixture_server
+
+    n_titles = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    server = start_fixture_server(latency=0.02)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    urls = [review_url(f"tt{i:07d}", base_url) for i in range(n_titles)]
+
+    try:
+        start = time.perf_counter()
+        for url in urls:
+            fetch(url)
+        sequential = time.perf_counter() - start
+
+        for workers in (1, 8, 32):
+            start = time.perf_counter()
+            results = fetch_many(urls, max_workers=workers)
+            elapsed = time.perf_counter() - start
+            failed = sum(1 for item in results if item['error'] is not None)
+            print(f"pooled, {workers:2d} workers: {n_titles / elapsed:8.1f} pages/s ({failed} failed)")
+        print(f"bare requests.get:     {n_titles / sequential:8.1f} pages/s")
+
+        cache = ResponseCache(path=":memory:", ttl=0)
+        for label in ("cold cache", "revalidate"):
+            start = time.perf_counter()
+            fetch_many(urls, max_workers=8, cache=cache)
+            print(f"{label:22s} {n_titles / (time.perf_counter() - start):8.1f} pages/s")
+        cache.ttl = 3600
+        start = time.perf_counter()
+        fetch_many(urls, max_workers=8, cache=cache)
+        print(f"{'fresh cache':22s} {n_titles / (time.perf_counter() - start):8.1f} pages/s")
+        print(f"cache stats: {cache.stats()}")
+    finally:
+        server.shutdown()
+
+    # Sustained throughput against a server that answers 429 above 50 requests/s.
+    server = start_fixture_server(latency=0.02, max_rps=50)
+    urls = [review_url(f"tt{i:07d}", f"http://127.0.0.1:{server.server_port}") for i in range(n_titles)]
+    try:
+        start = time.perf_counter()
+        results = fetch_many(urls, max_workers=16)
+        failed = sum(1 for item in results if item['error'] is not None)
+        print(f"throttled, no limiter:  {n_titles / (time.perf_counter() - start):8.1f} pages/s ({failed} failed)")
+
+        time.sleep(1)
+        limiter = RateLimiter(rate=45, burst=10, max_concurrency=16)
+        start = time.perf_counter()
+        results = fetch_many(urls, max_workers=16, limiter=limiter)
+        failed = sum(1 for item in results if item['error'] is not None)
+        print(f"throttled, rate limiter:{n_titles / (time.perf_counter() - start):8.1f} pages/s ({failed} failed)")
+        print(f"limiter stats: {limiter.stats()}")
+    finally:
+        server.shutdown()
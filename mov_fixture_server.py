@@ -0,0 +1,272 @@
+import collections
+import datetime
+import hashlib
+import json
+import mimetypes
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SAMPLE_TITLES = [
+    "Masterpiece",
+    "Overrated",
+    "10/10",
+    "A complete waste of two hours",
+    "The cinematography was breathtaking, but the plot dragged",
+    "Perfectly average",
+    "Must see it again",
+    "Too long and the script was lazy",
+]
+
+REVIEWS_PATH_RE = re.compile(r'^/title/(tt\d+)/reviews/?$')
+AJAX_PATH_RE = re.compile(r'^/title/(tt\d+)/reviews/_ajax$')
+JSON_PATH_RE = re.compile(r'^/title/(tt\d+)/reviews/_json$')
+DYNAMIC_PATH_RE = re.compile(r'^/title/(tt\d+)/reviews/dynamic$')
+PAGINATION_KEY_RE = re.compile(r'paginationKey=p(\d+)')
+
+
+def review_date(index):
+    """Review `index` is `index` days older than the newest one, so pages list newest first."""
+    return (datetime.date(2024, 12, 31) - datetime.timedelta(days=index)).strftime("%d %B %Y").lstrip("0")
+
+
+def render_review_cards(title_id, start, stop):
+    cards = []
+    for i in range(start, stop):
+        title = SAMPLE_TITLES[i % len(SAMPLE_TITLES)]
+        cards.append(
+            f'<article class="sc-review user-review-item" data-review-id="rw{i:07d}">'
+            f'<div class="ipc-title"><h3 class="ipc-title__text">{title}</h3></div>'
+            f'<span class="review-date">{review_date(i)}</span>'
+            f'<div class="ipc-html-content">Review body {i} for {title_id}.</div>'
+            f'</article>'
+        )
+    return "".join(cards)
+
+
+def render_load_more(next_key):
+    if next_key is None:
+        return ""
+    return f'<div class="load-more-data" data-key="{next_key}"></div><button>Load More</button>'
+
+
+def render_review_page(title_id, n_reviews=25, total_reviews=None):
+    """
+    Renders a minimal IMDb-like review page with the first `n_reviews` cards.
+    When `total_reviews` is larger, a load-more pagination key is embedded.
+    """
+    total_reviews = n_reviews if total_reviews is None else total_reviews
+    stop = min(n_reviews, total_reviews)
+    next_key = "p1" if stop < total_reviews else None
+    return (
+        f"<html><head><title>{title_id} - User reviews</title></head><body>"
+        f"<section>{render_review_cards(title_id, 0, stop)}{render_load_more(next_key)}</section>"
+        f"</body></html>"
+    ).encode("utf-8")
+
+
+def render_ajax_page(title_id, page, n_reviews, total_reviews):
+    """Renders the HTML fragment returned for the `page`-th load-more request."""
+    start = page * n_reviews
+    stop = min(start + n_reviews, total_reviews)
+    next_key = f"p{page + 1}" if stop < total_reviews else None
+    return f"<div>{render_review_cards(title_id, start, stop)}{render_load_more(next_key)}</div>".encode("utf-8")
+
+
+def render_review_json(title_id, page, n_reviews, total_reviews):
+    """Renders one page of reviews as a GraphQL-style JSON payload, like IMDb's load-more XHR."""
+    start = page * n_reviews
+    stop = min(start + n_reviews, total_reviews)
+    edges = [
+        {"node": {"id": f"rw{i:07d}",
+                  "summary": {"originalText": SAMPLE_TITLES[i % len(SAMPLE_TITLES)]},
+                  "text": {"originalText": {"plainText": f"Review body {i} for {title_id}."}}}}
+        for i in range(start, stop)
+    ]
+    page_info = {"endCursor": f"p{page + 1}" if stop < total_reviews else None,
+                 "hasNextPage": stop < total_reviews}
+    return json.dumps({"data": {"title": {"reviews": {"edges": edges, "pageInfo": page_info}}}}).encode("utf-8")
+
+
+DYNAMIC_PAGE_SCRIPT = """
+document.getElementById('load-more').addEventListener('click', async function () {
+    const button = this;
+    const response = await fetch('_json?paginationKey=' + button.dataset.key);
+    const reviews = (await response.json()).data.title.reviews;
+    const section = document.getElementById('reviews');
+    for (const edge of reviews.edges) {
+        const card = document.createElement('article');
+        card.className = 'sc-review user-review-item';
+        card.dataset.reviewId = edge.node.id;
+        const heading = document.createElement('h3');
+        heading.textContent = edge.node.summary.originalText;
+        card.appendChild(heading);
+        section.appendChild(card);
+    }
+    if (reviews.pageInfo.hasNextPage) {
+        button.dataset.key = reviews.pageInfo.endCursor;
+    } else {
+        button.remove();
+    }
+});
+"""
+
+
+def render_dynamic_review_page(title_id, n_reviews=25, total_reviews=None):
+    """
+    Renders a review page whose first cards are embedded as __NEXT_DATA__ JSON
+    and whose Load More button fetches further pages from the _json endpoint.
+    """
+    total_reviews = n_reviews if total_reviews is None else total_reviews
+    stop = min(n_reviews, total_reviews)
+    next_data = {"props": {"pageProps": {"contentData": {"reviews": [
+        {"review": {"reviewId": f"rw{i:07d}", "reviewSummary": SAMPLE_TITLES[i % len(SAMPLE_TITLES)]}}
+        for i in range(stop)
+    ]}}}}
+    button = '<button id="load-more" data-key="p1">Load More</button>' if stop < total_reviews else ""
+    return (
+        f"<html><head><title>{title_id} - User reviews</title>"
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script></head><body>'
+        f'<section id="reviews">{render_review_cards(title_id, 0, stop)}</section>{button}'
+        f"<script>{DYNAMIC_PAGE_SCRIPT}</script></body></html>"
+    ).encode("utf-8")
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_page(self, body, content_type="text/html; charset=utf-8"):
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_body(304, b"", headers={"ETag": etag})
+        else:
+            self.send_body(200, body, content_type=content_type, headers={"ETag": etag})
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            server.request_count += 1
+            now = time.monotonic()
+            if server.max_rps:
+                while server.recent and server.recent[0] <= now - 1.0:
+                    server.recent.popleft()
+                throttled = len(server.recent) >= server.max_rps
+                if throttled:
+                    server.throttled_count += 1
+                else:
+                    server.recent.append(now)
+            else:
+                throttled = False
+        if throttled:
+            self.send_body(429, b"Too Many Requests", content_type="text/plain",
+                           headers={"Retry-After": str(server.retry_after)})
+            return
+
+        path, _, query = self.path.partition("?")
+        match = REVIEWS_PATH_RE.match(path)
+        ajax_match = AJAX_PATH_RE.match(path) or JSON_PATH_RE.match(path)
+        dynamic_match = DYNAMIC_PATH_RE.match(path)
+        if match:
+            self.send_page(render_review_page(match.group(1), server.reviews_per_page, server.total_reviews))
+        elif dynamic_match:
+            self.send_page(render_dynamic_review_page(
+                dynamic_match.group(1), server.reviews_per_page, server.total_reviews))
+        elif ajax_match:
+            key_match = PAGINATION_KEY_RE.search(query)
+            if not key_match:
+                self.send_body(400, b"Missing paginationKey", content_type="text/plain")
+            elif path.endswith("_json"):
+                self.send_page(render_review_json(
+                    ajax_match.group(1), int(key_match.group(1)), server.reviews_per_page, server.total_reviews),
+                    content_type="application/json")
+            else:
+                self.send_page(render_ajax_page(
+                    ajax_match.group(1), int(key_match.group(1)), server.reviews_per_page, server.total_reviews))
+        elif path in server.pages:
+            content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            if content_type == "text/html":
+                content_type += "; charset=utf-8"
+            self.send_page(server.pages[path], content_type=content_type)
+        else:
+            self.send_body(404, b"Not Found", content_type="text/plain")
+
+
+def render_static_site(title_id="tt7817340", n_reviews=25, n_images=20, image_size=100_000):
+    """
+    Builds a static review page plus the heavy assets a real IMDb page pulls in
+    (posters, a web font, a stylesheet, a video), as a `pages` dict for start_fixture_server.
+    The page itself is served at /static/reviews.html.
+    """
+    images = "".join(f'<img src="/static/poster{i}.jpg">' for i in range(n_images))
+    body = render_review_page(title_id, n_reviews).decode("utf-8").replace(
+        "<section>", f"<div>{images}<video src=\"/static/trailer.mp4\" autoplay></video></div><section>", 1)
+    head = ('<link rel="stylesheet" href="/static/style.css">'
+            '<style>@font-face { font-family: Imdb; src: url(/static/font.woff2); } body { font-family: Imdb; }</style>')
+    pages = {
+        "/static/reviews.html": body.replace("<head>", "<head>" + head, 1).encode("utf-8"),
+        "/static/style.css": b"h3 { font-weight: bold; }\n" * 2000,
+        "/static/font.woff2": bytes(image_size),
+        "/static/trailer.mp4": bytes(image_size * 10),
+    }
+    for i in range(n_images):
+        pages[f"/static/poster{i}.jpg"] = bytes(image_size)
+    return pages
+
+
+def start_fixture_server(pages=None, port=0, latency=0.0, reviews_per_page=25, total_reviews=None,
+                         max_rps=None, retry_after=1):
+    """
+    Starts a local HTTP fixture server in a background thread and returns it.
+
+    Any /title/<tt id>/reviews/ path is served as a synthetic review page;
+    if `total_reviews` exceeds `reviews_per_page`, the remaining cards are served
+    page by page from /title/<tt id>/reviews/_ajax?paginationKey=pN (HTML) and
+    _json?paginationKey=pN (JSON). /title/<tt id>/reviews/dynamic serves a page
+    whose Load More button fetches that JSON with JavaScript.
+    `pages` maps extra paths to raw bytes. `latency` adds a fixed delay
+    per request so network round-trips can be simulated offline. With `max_rps`,
+    requests beyond that many per second get a 429 with Retry-After: `retry_after`.
+    Call server.shutdown() when done; server.server_port holds the bound port.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), FixtureHandler)
+    server.daemon_threads = True
+    server.pages = dict(pages or {})
+    server.latency = latency
+    server.reviews_per_page = reviews_per_page
+    server.total_reviews = reviews_per_page if total_reviews is None else total_reviews
+    server.request_count = 0
+    server.max_rps = max_rps
+    server.retry_after = retry_after
+    server.recent = collections.deque()
+    server.throttled_count = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    server = start_fixture_server()
+    print(f"Fixture server running on http://127.0.0.1:{server.server_port}/title/tt0000001/reviews/")
+    print("Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
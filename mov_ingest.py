@@ -0,0 +1,158 @@
+import contextlib
+import json
+import os
+import sys
+import time
+
+from mov_normalize import normalize_reviews
+from mov_labels import label_for_compound
+
+DEFAULT_INGEST_CHUNK = 10_000
+IO_BUFFER_BYTES = 1 << 20
+TEXT_FIELDS = ("text", "review", "title", "body")
+ID_FIELDS = ("id", "review_id", "request_id")
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+
+
+def default_output_path(source):
+    """reviews.txt -> reviews.scored.jsonl; stdin ('-') -> stdin.scored.jsonl."""
+    if source == "-":
+        return "stdin.scored.jsonl"
+    return os.path.splitext(source)[0] + ".scored.jsonl"
+
+
+def is_jsonl_source(source):
+    """JSON Lines if the file name ends in .jsonl or .ndjson; stdin ('-') is plain text."""
+    return os.path.splitext(source)[1].lower() in JSONL_EXTENSIONS
+
+
+def open_source(source):
+    if source == "-":
+        return sys.stdin
+    return open(source, encoding="utf-8", errors="replace", buffering=IO_BUFFER_BYTES)
+
+
+def open_output(output):
+    if output == "-":
+        return sys.stdout
+    return open(output, "w", encoding="utf-8", buffering=IO_BUFFER_BYTES)
+
+
+def iter_records(lines, field=None, skipped=None, jsonl=False):
+    """
+    Yields (record_id, text) from plain text (one review per line, the line
+    number as ID) or, with jsonl=True, JSON Lines. A JSON record's text is
+    `field`, or the first of TEXT_FIELDS it has; its ID is the first of
+    ID_FIELDS, else the line number. Blank lines, bad JSON and records
+    without text are counted in `skipped` (a one-item list).
+    """
+    skipped = skipped if skipped is not None else [0]
+    fields = (field,) if field else TEXT_FIELDS
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not jsonl:
+            yield line_number, line
+            continue
+        try:
+            record = json.loads(line)
+            text = next(record[name] for name in fields if isinstance(record.get(name), str))
+        except (ValueError, AttributeError, StopIteration):
+            skipped[0] += 1
+            continue
+        record_id = next((record[name] for name in ID_FIELDS if name in record), line_number)
+        yield record_id, text
+
+
+def iter_chunks(records, chunk_size=DEFAULT_INGEST_CHUNK):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ingest_reviews(source, scorer, output, aggregator=None, field=None, chunk_size=DEFAULT_INGEST_CHUNK,
+                   progress=sys.stderr, jsonl=None):
+    """
+    Scores every review in `source` (a path, '-' for stdin, or a file already
+    opened with open_source, which the caller closes) in chunks of
+    `chunk_size` through scorer.score_many and appends one JSON line per review
+    to the open text file `output`: {"id", "label", "compound", "neg", "neu", "pos"}.
+    Each chunk is written with a single write call; per-review output goes
+    only to the file, and `progress` gets one overwritten status line per
+    chunk. The input is read as JSON Lines if `jsonl` is True, or if it is
+    None and is_jsonl_source accepts the file name.
+    Returns {'reviews', 'skipped', 'seconds'}.
+    """
+    start = time.perf_counter()
+    total = 0
+    skipped = [0]
+    lines = open_source(source) if isinstance(source, str) else source
+    if jsonl is None:
+        jsonl = is_jsonl_source(source if isinstance(source, str) else getattr(source, "name", ""))
+    try:
+        for chunk in iter_chunks(iter_records(lines, field, skipped, jsonl), chunk_size):
+            record_ids = [record_id for record_id, _ in chunk]
+            scores = scorer.score_many(normalize_reviews([text for _, text in chunk])).tolist()
+            labels = [label_for_compound(compound) for _, _, _, compound in scores]
+            if aggregator is not None:
+                aggregator.add_many(labels, [compound for _, _, _, compound in scores])
+            output.write("".join(
+                f'{{"id": {json.dumps(record_id)}, "label": "{label}", "compound": {compound}, '
+                f'"neg": {neg}, "neu": {neu}, "pos": {pos}}}\n'
+                for record_id, label, (neg, neu, pos, compound) in zip(record_ids, labels, scores)))
+            total += len(chunk)
+            if progress is not None:
+                elapsed = time.perf_counter() - start
+                progress.write(f"\rIngested {total:,} reviews ({total / elapsed:,.0f}/s)")
+                progress.flush()
+    finally:
+        if lines is not source and lines is not sys.stdin:
+            lines.close()
+    if progress is not None and total:
+        progress.write("\n")
+    return {'reviews': total, 'skipped': skipped[0], 'seconds': time.perf_counter() - start}
+
+
+def run_bulk_ingest(scorer, source, output_path, aggregator, field=None, jsonl=None, print_summary=None):
+    """
+    Scores a whole file ('-' for stdin) in chunks through the batch scorer
+    and writes one JSON line per review to output_path ('-' for stdout). The
+    input is read as JSON Lines for .jsonl/.ndjson files or with jsonl=True,
+    else as one review per line. Only progress, a one-line report and the
+    aggregate summary are printed; `print_summary(aggregator, title=...)` is
+    the calling script's summary printer. Returns the ingest_reviews result,
+    or None if a file could not be opened.
+    """
+    # With results on stdout, the human-readable report goes to stderr.
+    report = sys.stderr if output_path == "-" else sys.stdout
+    try:
+        # Source first: a missing input must not truncate an existing output file.
+        lines = open_source(source)
+        try:
+            output = open_output(output_path)
+            try:
+                result = ingest_reviews(lines, scorer, output, aggregator=aggregator, field=field,
+                                        jsonl=jsonl if jsonl is not None else is_jsonl_source(source))
+            finally:
+                if output is sys.stdout:
+                    output.flush()
+                else:
+                    output.close()
+        finally:
+            if lines is not sys.stdin:
+                lines.close()
+    except OSError as e:
+        print(f"❌ Bulk ingest failed: {e}", file=sys.stderr)
+        return None
+    print(f"Ingested {result['reviews']:,} reviews from {source} in {result['seconds']:.2f}s "
+          f"({result['skipped']} skipped). Results written to {output_path}.", file=report)
+    if print_summary is not None:
+        with contextlib.redirect_stdout(report):
+            print_summary(aggregator, title="BULK INGEST SUMMARY")
+    return result
@@ -0,0 +1,11 @@
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+
+def label_for_compound(compound_score):
+    """VADER's usual cut-offs: compound >= 0.05 is Positive, <= -0.05 Negative, anything between Neutral."""
+    if compound_score >= POSITIVE_THRESHOLD:
+        return "Positive"
+    if compound_score <= NEGATIVE_THRESHOLD:
+        return "Negative"
+    return "Neutral"
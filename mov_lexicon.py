@@ -0,0 +1,208 @@
+import marshal
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
+DEFAULT_LEXICON_CACHE_PATH = ".vader_lexicon.marshal"
+DEFAULT_MAPPED_LEXICON_PATH = ".vader_lexicon.map"
+LEXICON_RESOURCE = "sentiment/vader_lexicon.zip"
+CACHE_FORMAT = 1
+# magic, entry count, size of the word table, size of the marshalled small tables
+MAPPED_HEADER = struct.Struct("<4sIII")
+MAPPED_MAGIC = b"VLX1"
+
+_loaded = {}
+_mapped = {}
+
+
+def tables_from_analyzer(analyzer):
+    """The lookup tables VADER scoring needs, taken from a SentimentIntensityAnalyzer."""
+    constants = analyzer.constants
+    return {
+        'lexicon': dict(analyzer.lexicon),
+        'booster': dict(constants.BOOSTER_DICT),
+        'idioms': dict(constants.SPECIAL_CASE_IDIOMS),
+        'negate': list(constants.NEGATE),
+        'punc_list': list(constants.PUNC_LIST),
+        'c_incr': constants.C_INCR,
+        'b_decr': constants.B_DECR,
+        'n_scalar': constants.N_SCALAR,
+    }
+
+
+def _source_signature(path):
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            cache = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(cache, dict) or cache.get('format') != CACHE_FORMAT:
+        return None
+    if _source_signature(cache.get('source')) != cache.get('source_signature'):
+        return None
+    return cache['tables']
+
+
+def lexicon_cache_ready(cache_path=DEFAULT_LEXICON_CACHE_PATH):
+    """True when the binary lexicon cache exists and its source lexicon has not changed since it was built."""
+    if cache_path not in _loaded:
+        tables = _read_cache(cache_path)
+        if tables is None:
+            return False
+        # Kept so the load_vader_tables call that follows does not read the file again.
+        _loaded[cache_path] = tables
+    return True
+
+
+def build_lexicon_cache(cache_path=DEFAULT_LEXICON_CACHE_PATH):
+    """Parses NLTK's zipped VADER lexicon once and writes the tables to a marshal file."""
+    import nltk
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+    tables = tables_from_analyzer(SentimentIntensityAnalyzer())
+    source = getattr(nltk.data.find(LEXICON_RESOURCE), "path", None)
+    cache = {'format': CACHE_FORMAT, 'source': source, 'source_signature': _source_signature(source),
+             'tables': tables}
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        marshal.dump(cache, f)
+    os.replace(temp_path, cache_path)
+    return tables
+
+
+def load_vader_tables(cache_path=DEFAULT_LEXICON_CACHE_PATH):
+    """
+    VADER tables from the marshal cache without importing nltk; the cache is
+    (re)built from NLTK's lexicon on first use or when that file changes.
+    Loaded tables are shared by every caller in the process.
+    """
+    tables = _loaded.get(cache_path)
+    if tables is None:
+        tables = _read_cache(cache_path) or build_lexicon_cache(cache_path)
+        _loaded[cache_path] = tables
+    return tables
+
+
+class MappedLexicon(Mapping):
+    """
+    Read-only VADER lexicon over a memory-mapped file (see write_mapped_lexicon).
+
+    Words are looked up by binary search over the sorted UTF-8 string table,
+    so nothing is copied into the process: every worker mapping the same file
+    shares its pages through the OS page cache. Valences are stored as float32
+    and rounded back to 4 decimals on lookup, which restores the lexicon's
+    one-decimal values exactly.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, words_size, _ = MAPPED_HEADER.unpack_from(self.buffer)
+        if magic != MAPPED_MAGIC:
+            raise ValueError(f"{path} is not a mapped VADER lexicon")
+        self.count = count
+        offsets_start = MAPPED_HEADER.size
+        valences_start = offsets_start + 4 * (count + 1)
+        self.words_start = valences_start + 4 * count
+        view = memoryview(self.buffer)
+        self.offsets = view[offsets_start:valences_start].cast("I")
+        self.valences = view[valences_start:self.words_start].cast("f")
+
+    def _word(self, index):
+        start = self.words_start
+        return self.buffer[start + self.offsets[index]:start + self.offsets[index + 1]]
+
+    def _find(self, word):
+        key = word.encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._word(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self.count and self._word(low) == key else -1
+
+    def get(self, word, default=None):
+        index = self._find(word)
+        return default if index < 0 else round(self.valences[index], 4)
+
+    def __getitem__(self, word):
+        index = self._find(word)
+        if index < 0:
+            raise KeyError(word)
+        return round(self.valences[index], 4)
+
+    def __contains__(self, word):
+        return isinstance(word, str) and self._find(word) >= 0
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self._word(index).decode("utf-8")
+
+    def __len__(self):
+        return self.count
+
+
+def write_mapped_lexicon(tables, path=DEFAULT_MAPPED_LEXICON_PATH):
+    """
+    Writes the mapped lexicon: header, uint32 offsets into the word table,
+    float32 valences, the sorted UTF-8 words, then the small tables (booster,
+    idioms, negations, constants) marshalled. Written to a temporary file and
+    renamed, so workers that already mapped the old file keep a valid view.
+    """
+    words = sorted(word.encode("utf-8") for word in tables['lexicon'])
+    offsets = np.zeros(len(words) + 1, dtype="<u4")
+    np.cumsum([len(word) for word in words], out=offsets[1:])
+    valences = np.array([tables['lexicon'][word.decode("utf-8")] for word in words], dtype="<f4")
+    word_table = b"".join(words)
+    extras = marshal.dumps({name: value for name, value in tables.items() if name != 'lexicon'})
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(MAPPED_HEADER.pack(MAPPED_MAGIC, len(words), len(word_table), len(extras)))
+        f.write(offsets.tobytes())
+        f.write(valences.tobytes())
+        f.write(word_table)
+        f.write(extras)
+    os.replace(temp_path, path)
+
+
+def ensure_mapped_lexicon(path=DEFAULT_MAPPED_LEXICON_PATH, cache_path=DEFAULT_LEXICON_CACHE_PATH):
+    """(Re)builds the mapped lexicon from the marshal cache when missing or older than it; returns the path."""
+    if not lexicon_cache_ready(cache_path):
+        build_lexicon_cache(cache_path)
+    try:
+        fresh = os.stat(path).st_mtime_ns >= os.stat(cache_path).st_mtime_ns
+    except OSError:
+        fresh = False
+    if not fresh:
+        write_mapped_lexicon(load_vader_tables(cache_path), path)
+    return path
+
+
+def load_mapped_tables(path=DEFAULT_MAPPED_LEXICON_PATH):
+    """
+    VADER tables whose lexicon is a MappedLexicon, for VaderBatchScorer(tables=...).
+    The file must already exist (ensure_mapped_lexicon, run once by the parent).
+    """
+    tables = _mapped.get(path)
+    if tables is None:
+        lexicon = MappedLexicon(path)
+        _, _, words_size, extras_size = MAPPED_HEADER.unpack_from(lexicon.buffer)
+        extras_start = lexicon.words_start + words_size
+        tables = marshal.loads(lexicon.buffer[extras_start:extras_start + extras_size])
+        tables['lexicon'] = lexicon
+        _mapped[path] = tables
+    return tables
@@ -1,23 +1,19 @@
 import requests
 from lxml import html
 import sys
+from mov_fetch import fetch, ResponseCache
 
-def get_all_review_titles_by_xpath(url):
+def get_all_review_titles_by_xpath(url, cache=None):
     """
     使用 requests 和 lxml 透過相對 XPath 爬取頁面上所有評論的標題。
 
     :param url: IMDb 評論頁面的完整 URL
+    :param cache: 可選的 ResponseCache，重複執行時以快取或 304 取代完整下載
     :return: 評論標題列表
     """
-    # 設置 User-Agent 模擬瀏覽器請求
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         print(f"步驟 1: 正在請求網址: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response, _ = fetch(url, timeout=10, cache=cache)
 
         print("步驟 2: 成功獲取內容，正在解析 HTML。")
         tree = html.fromstring(response.content)
@@ -64,7 +60,9 @@ if __name__ == "__main__":
     target_url = "https://www.imdb.com/title/tt0903747/reviews/?ref_=tt_ov_ururv"
 
     print("--- IMDb 所有評論標題 XPath 爬蟲 ---")
-    all_titles = get_all_review_titles_by_xpath(target_url)
+    response_cache = ResponseCache()
+    all_titles = get_all_review_titles_by_xpath(target_url, cache=response_cache)
+    print(f"快取統計: {response_cache.stats()}")
     print("--------------------------------------")
     
     if all_titles:
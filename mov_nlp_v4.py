@@ -3,7 +3,7 @@ import nltk
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 import os
 from collections import Counter 
-import re # Added for text preprocessing
+from mov_normalize import normalize_review
 
 # --- VADER Sentiment Analyzer is based on English lexicon and rules ---
 # VADER is primarily trained on English text. Its accuracy may decrease 
@@ -44,15 +44,7 @@ def preprocess_review(review):
     Cleans a scraped review string by removing common noise like
     leading numbers/bullets and simple Markdown formatting.
     """
-    # 1. Remove leading numbers/bullets (e.g., '1. ', '1) ', '- ', '* ', or numbers followed by **)
-    # This regex handles leading numbers followed by punctuation or just space, and optional starting markdown
-    review = re.sub(r'^\s*[\d\.\)]+\s*(\*\*|\*|)\s*', '', review).strip()
-    
-    # 2. Remove common markdown/formatting (e.g., **bold**, *italic*, `code`)
-    review = re.sub(r'[\*\`\#]+', '', review) # Remove **, *, `, #
-    
-    # 3. Trim remaining leading/trailing whitespace
-    return review.strip()
+    return normalize_review(review)
 
 def get_simulated_streaming_data():
     """
@@ -1,41 +1,57 @@
-import requests
-from lxml import html
+import os
 import sys
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
 from collections import Counter 
-import re
+from mov_watermark import WatermarkStore, title_id_from_url
+from mov_lexicon import lexicon_cache_ready
+from mov_vader import VaderBatchScorer
+from mov_parallel import score_in_parallel
+from mov_score_cache import ScoreCache, DEFAULT_SCORE_CACHE_PATH
+from mov_normalize import normalize_review, normalize_reviews
+from mov_pipeline import ReviewPipeline
+from mov_aggregate import SentimentAggregator
+from mov_results import ResultStore
+from mov_review_db import ReviewDatabase
+from mov_cli import flag_value, positive_int
+from mov_ingest import default_output_path, run_bulk_ingest
 
-def get_all_review_titles_by_xpath(url):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+USAGE = ("Usage: python mov_nlp_v6.py [--incremental] [--stream] [--record PATH | --replay PATH] [--window N]\n"
+         "                     [--keep-history] [--save-db] [--results PATH] [--score-cache] [--workers N]")
+
+# requests and lxml (through mov_fetch, mov_extract and mov_archive) are
+# imported inside the functions that scrape, as in mov_nlp_v7.
+
+def get_all_reviews_by_xpath(url, session=None, cache=None, limiter=None, watermarks=None, page_store=None):
+    """Returns the page's reviews as {'review_id', 'title', 'date'} dicts; fallback titles have neither ID nor date."""
+    import requests
+    from lxml import html
+    from mov_fetch import fetch
+    from mov_extract import extract_titles, extract_review_cards, REVIEW_TITLE_SELECTOR
 
     try:
         print(f"Step 1: Requesting URL: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response, _ = fetch(url, session=session, timeout=10, cache=cache, limiter=limiter)
+        if page_store is not None:
+            page_store.put(url, response.content)
 
         print("Step 2: Successfully fetched content. Parsing HTML.")
-        tree = html.fromstring(response.content)
-        
-        relative_xpath = "//article[contains(@class, 'user-review-item')]//h3"
-        print(f"Step 3: Executing relative XPath query: {relative_xpath}")
-        title_elements = tree.xpath(relative_xpath)
-        
-        if not title_elements:
-            title_elements = tree.xpath("//article//h3")
-            if title_elements:
-                print("    (Using fallback generic XPath query.)")
-            else:
-                print("    Warning: No title elements found.")
-                return []
-        
-        titles = []
-        for element in title_elements:
-            titles.append(element.text_content().strip())
-        
-        return titles
+        print(f"Step 3: Executing relative XPath query: {REVIEW_TITLE_SELECTOR.path}")
+        cards = [card for card in extract_review_cards(html.fromstring(response.content)) if card['title'] is not None]
+        if not cards:
+            cards = [{'review_id': None, 'title': title, 'date': None}
+                     for title in extract_titles(response.content, verbose=True)]
+        if watermarks is None:
+            return cards
+
+        # Reviews from a run that stopped before scoring are still in the checkpoint.
+        title_id = title_id_from_url(url)
+        checkpoint = watermarks.load_checkpoint(title_id)
+        pending = checkpoint['reviews'] if checkpoint else []
+        new_cards = watermarks.filter_new(title_id, cards)
+        reviews = pending + new_cards
+        watermarks.commit_page(title_id, new_cards, loaded=len(reviews), pending=reviews)
+        print(f"    {len(new_cards)} of {len(cards)} reviews are new since the last run"
+              f" ({len(pending)} more left unscored by an earlier run).")
+        return reviews
 
     except requests.exceptions.RequestException as err:
         print(f" Request error: {err}", file=sys.stderr)
@@ -44,13 +60,72 @@ def get_all_review_titles_by_xpath(url):
         print(f" Unknown error: {e}", file=sys.stderr)
         return []
 
+def iter_review_titles_streaming(url, session=None):
+    import requests
+    from mov_fetch import fetch_stream
+    from mov_extract import iter_titles_streaming
+
+    try:
+        yield from iter_titles_streaming(fetch_stream(url, session=session, timeout=10))
+    except requests.exceptions.RequestException as err:
+        print(f" Request error: {err}", file=sys.stderr)
+    except Exception as e:
+        print(f" Unknown error: {e}", file=sys.stderr)
+
+def get_review_titles_for_many(title_ids, max_workers=8, base_url="https://www.imdb.com", report=True, cache=None, limiter=None, session=None, page_store=None):
+    from mov_fetch import fetch_many, review_url, print_latency_report
+    from mov_extract import extract_titles
+
+    title_ids = list(title_ids)
+    urls = [review_url(title_id, base_url) for title_id in title_ids]
+    def parse(response):
+        if page_store is not None:
+            page_store.put(response.url, response.content)
+        return extract_titles(response.content)
+
+    results = fetch_many(urls, parse=parse, max_workers=max_workers, session=session, cache=cache, limiter=limiter)
+    if report:
+        print_latency_report(results, title="BULK REVIEW FETCH LATENCY")
+        if limiter is not None:
+            print(f"Rate limiter: {limiter.stats()}")
+
+    titles_by_id = {}
+    for title_id, item in zip(title_ids, results):
+        if item['error'] is not None:
+            print(f" Request error for {title_id}: {item['error']}", file=sys.stderr)
+            titles_by_id[title_id] = []
+        else:
+            titles_by_id[title_id] = item['result']
+    return titles_by_id
+
 if __name__ == "__main__":
     target_url = "https://www.imdb.com/title/tt6483832/reviews/?ref_=tt_ov_ururv"
+    # Option values are checked before anything is scraped.
+    window_size = flag_value(sys.argv, "--window", positive_int, usage=USAGE)
+    results_path = flag_value(sys.argv, "--results", usage=USAGE)
+    workers = flag_value(sys.argv, "--workers", positive_int, usage=USAGE)
     print("--- IMDb Review Titles Scraper ---")
-    all_titles = get_all_review_titles_by_xpath(target_url)
+    from mov_fetch import ResponseCache, RateLimiter
+    from mov_archive import session_from_argv
+    response_cache = ResponseCache()
+    rate_limiter = RateLimiter()
+    watermarks = WatermarkStore() if "--incremental" in sys.argv else None
+    stream_source = None
+    if "--stream" in sys.argv:
+        stream_source = iter_review_titles_streaming(target_url, session=session_from_argv(sys.argv))
+        all_reviews = []
+    else:
+        all_reviews = get_all_reviews_by_xpath(target_url, session=session_from_argv(sys.argv),
+                                               cache=response_cache, limiter=rate_limiter, watermarks=watermarks)
+        print(f"Response cache: {response_cache.stats()}")
+        print(f"Rate limiter: {rate_limiter.stats()}")
+    # Scoring works on the titles; the review IDs and dates go to the review database.
+    all_titles = [review['title'] for review in all_reviews]
     print("--------------------------------------")
     
-    if all_titles:
+    if stream_source is not None:
+        print("Streaming mode: reviews are scored while the page is still downloading.")
+    elif all_titles:
         print(f"Total {len(all_titles)} review titles fetched.")
         print("\n**First 10 Review Titles:**")
         titles_to_display = all_titles[:10] 
@@ -63,6 +138,8 @@ if __name__ == "__main__":
     print("--------------------------------------")
 
     def ensure_nltk_data():
+        import nltk
+
         try:
             nltk.data.find('sentiment/vader_lexicon.zip')
         except nltk.downloader.DownloadError:
@@ -73,19 +150,21 @@ if __name__ == "__main__":
             nltk.download('vader_lexicon')
 
     def preprocess_review(review):
-        review = re.sub(r'^\s*[\d\.\)]+\s*(\*\*|\*|)\s*', '', review).strip()
-        review = re.sub(r'[\*\`\#]+', '', review)
-        return review.strip()
+        return normalize_review(review)
 
     def calculate_and_print_summary(history, title="COMPREHENSIVE MOVIE REVIEW SUMMARY"):
-        if not history:
+        # `history` is a list of labels, or a SentimentAggregator / ResultStore that counts itself.
+        counts = history.counts() if hasattr(history, "counts") else Counter(history)
+        print_summary_from_counts(counts, title=title)
+
+    def print_summary_from_counts(counts, title="COMPREHENSIVE MOVIE REVIEW SUMMARY"):
+        total = sum(counts.values())
+        if not total:
             print(f"\n[ {title} ]")
             print("No reviews entered yet.")
             print("-" * 60)
             return
 
-        counts = Counter(history)
-        total = len(history)
         pos_count = counts.get('Positive', 0)
         neg_count = counts.get('Negative', 0)
         neu_count = counts.get('Neutral', 0)
@@ -108,16 +187,33 @@ if __name__ == "__main__":
         print(f"Movie Assessment: {overall_sentiment}")
         print("=" * 60)
 
-    def run_batch_analysis(sid, reviews):
-        batch_history = []
+    def print_aggregate_summary(aggregator, title="COMPREHENSIVE MOVIE REVIEW SUMMARY"):
+        summary = aggregator.summary()
+        print_summary_from_counts(summary['counts'], title=title)
+        if summary['total']:
+            print(f"Compound Score: mean {summary['compound_mean']:+.4f}, std dev {summary['compound_stdev']:.4f}")
+            window = summary.get('window')
+            if window is not None:
+                counts = window['counts']
+                print(f"Recent Window ({window['total']} reviews): {counts.get('Positive', 0)} positive / "
+                      f"{counts.get('Negative', 0)} negative / {counts.get('Neutral', 0)} neutral, "
+                      f"mean {window['compound_mean']:+.4f}")
+            print("-" * 60)
+
+    def run_batch_analysis(scorer, reviews, cache=None, aggregator=None, results=None, database=None, title_id=None,
+                           review_ids=None, dates=None):
+        aggregator = aggregator if aggregator is not None else SentimentAggregator()
+        labels = []
         print("\n" + "#" * 60)
         print("           AUTOMATIC BATCH ANALYSIS STARTED             ")
         print("#" * 60)
         
-        for i, raw_review in enumerate(reviews):
-            review = preprocess_review(raw_review)
-            scores = sid.polarity_scores(review)
-            compound_score = scores['compound']
+        cleaned_reviews = normalize_reviews(reviews)
+        scores = (cache or scorer).score_many(cleaned_reviews)
+        compound_scores = scores['compound']
+        
+        for i, (raw_review, review) in enumerate(zip(reviews, cleaned_reviews)):
+            compound_score = float(compound_scores[i])
             
             if compound_score >= 0.05:
                 sentiment = "Positive"
@@ -126,31 +222,75 @@ if __name__ == "__main__":
             else:
                 sentiment = "Neutral"
             
-            batch_history.append(sentiment)
+            aggregator.add(sentiment, compound_score)
+            labels.append(sentiment)
             print(f"Review {i+1} (Processed: '{review[:30]}...'): '{raw_review[:40]}...' -> Classification: {sentiment} (Compound: {compound_score:.4f})")
 
-        calculate_and_print_summary(batch_history, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
-        return batch_history
+        if results is not None:
+            results.extend(labels, scores, texts=cleaned_reviews)
+        if database is not None:
+            database.save_reviews(title_id, reviews, cleaned_reviews, scores, labels, review_ids=review_ids,
+                                  dates=dates)
+        print_aggregate_summary(aggregator, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
+        return aggregator
+
+    def run_parallel_batch_analysis(reviews, workers=None, aggregator=None):
+        aggregator = aggregator if aggregator is not None else SentimentAggregator()
+        print("\n" + "#" * 60)
+        print("           AUTOMATIC BATCH ANALYSIS STARTED             ")
+        print(f"        (parallel mode, {workers or os.cpu_count()} worker processes)")
+        print("#" * 60)
+
+        cleaned_reviews = [preprocess_review(raw_review) for raw_review in reviews]
+        labels, compounds, _ = score_in_parallel(cleaned_reviews, workers=workers)
+        aggregator.add_many(labels, compounds.tolist())
+        print_aggregate_summary(aggregator, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
+        return aggregator
+
+    def run_streaming_analysis(source, cache=None, aggregator=None):
+        aggregator = aggregator if aggregator is not None else SentimentAggregator()
+        print("\n" + "#" * 60)
+        print("           STREAMING ANALYSIS STARTED             ")
+        print("#" * 60)
+
+        pipeline = ReviewPipeline(source, scorer=cache, aggregate=aggregator.add_many)
+        pipeline.run()
+        pipeline.print_report()
+        print_aggregate_summary(aggregator, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
+        return aggregator
 
-    def run_interactive_analyzer(sid, initial_history):
-        analysis_history = initial_history.copy()
+    def run_interactive_analyzer(scorer, aggregator, cache=None, results=None):
         print("=" * 60)
         print("         INTERACTIVE ANALYSIS MODE ACTIVATED          ")
         print("=" * 60)
         print("Please enter your movie review (English is highly recommended).")
         print("Type 'result' for a summary of all reviews so far.")
+        print("Type ':ingest <file or -> [output.jsonl]' to score a whole file or stdin in bulk.")
         print("Type 'exit' or 'quit' to end the program.")
         print("-" * 60)
 
         while True:
-            review = input(">>> Enter review: ")
+            try:
+                review = input(">>> Enter review: ")
+            except EOFError:
+                review = "exit"
             
             if review.lower() == 'result':
-                calculate_and_print_summary(analysis_history, title="CUMULATIVE REVIEW SUMMARY")
+                print_aggregate_summary(aggregator, title="CUMULATIVE REVIEW SUMMARY")
+                continue
+
+            parts = review.split()
+            if parts and parts[0].lower() == ':ingest':
+                if len(parts) in (2, 3):
+                    output_path = parts[2] if len(parts) == 3 else default_output_path(parts[1])
+                    run_bulk_ingest(scorer, parts[1], output_path, aggregator,
+                                    print_summary=print_aggregate_summary)
+                else:
+                    print("Usage: :ingest <file or -> [output.jsonl]")
                 continue
             
             if review.lower() in ['exit', 'quit']:
-                calculate_and_print_summary(analysis_history, title="FINAL CUMULATIVE SUMMARY")
+                print_aggregate_summary(aggregator, title="FINAL CUMULATIVE SUMMARY")
                 print("-" * 60)
                 print("Thank you for using the analyzer. Program terminated.")
                 break
@@ -160,7 +300,7 @@ if __name__ == "__main__":
 
             try:
                 cleaned_review = preprocess_review(review)
-                scores = sid.polarity_scores(cleaned_review)
+                scores = (cache or scorer).polarity_scores(cleaned_review)
                 compound_score = scores['compound']
                 
                 if compound_score >= 0.05:
@@ -170,7 +310,9 @@ if __name__ == "__main__":
                 else:
                     sentiment = "Neutral"
                 
-                analysis_history.append(sentiment)
+                aggregator.add(sentiment, compound_score)
+                if results is not None:
+                    results.append(sentiment, scores, text=cleaned_review)
 
                 print(f"\n[ Analysis Result ]")
                 print(f"  Sentiment Classification: {sentiment}")
@@ -182,7 +324,32 @@ if __name__ == "__main__":
                 print(f"An error occurred during analysis: {e}")
                 print("-" * 60)
 
-    ensure_nltk_data()
-    sid = SentimentIntensityAnalyzer()
-    initial_history = run_batch_analysis(sid, all_titles)
-    run_interactive_analyzer(sid, initial_history)
+    # nltk is only imported when the binary lexicon cache has to be (re)built.
+    if not lexicon_cache_ready():
+        ensure_nltk_data()
+    scorer = VaderBatchScorer()
+    aggregator = SentimentAggregator(
+        window_size=window_size,
+        keep_history="--keep-history" in sys.argv)
+    review_db = ReviewDatabase() if "--save-db" in sys.argv else None
+    # Per-review rows are only kept when asked for; the aggregator holds the running summary.
+    results = ResultStore(results_path) if results_path else None
+    score_cache = ScoreCache(scorer, path=DEFAULT_SCORE_CACHE_PATH if "--score-cache" in sys.argv else None)
+    if stream_source is not None:
+        run_streaming_analysis(stream_source, cache=score_cache, aggregator=aggregator)
+    elif workers is not None:
+        run_parallel_batch_analysis(all_titles, workers=workers, aggregator=aggregator)
+    else:
+        run_batch_analysis(scorer, all_titles, cache=score_cache, aggregator=aggregator, results=results,
+                           database=review_db, title_id=title_id_from_url(target_url),
+                           review_ids=[review['review_id'] for review in all_reviews],
+                           dates=[review['date'] for review in all_reviews])
+        print(f"Score cache: {score_cache.stats()}")
+        if results is not None:
+            print(f"Result store: {results.stats()}")
+    if watermarks is not None:
+        # The scraped titles are scored now, so the checkpoint holding them can go.
+        watermarks.clear_checkpoint(title_id_from_url(target_url))
+    run_interactive_analyzer(scorer, aggregator, cache=score_cache, results=results)
+    if results is not None:
+        results.close()
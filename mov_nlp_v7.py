@@ -1,92 +1,494 @@
+import os
 import time
 import sys
-import nltk
-import re
+import json
+import base64
 from collections import Counter
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from lxml import html
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-
-def scrape_all_titles_with_see_all(url, max_reviews=500):
-    LOAD_MORE_XPATH = "//button[contains(., 'more')]" 
-    SEE_ALL_XPATH = "//button[contains(., 'all')]" 
-    REVIEW_CARD_XPATH = "//article[contains(@class, 'user-review-item')]"
-    TITLE_XPATH = "//article//h3"
-    
+from urllib.parse import urlsplit, urlunsplit, urlencode
+from concurrent.futures import ThreadPoolExecutor
+from mov_watermark import WatermarkStore, title_id_from_url
+from mov_lexicon import lexicon_cache_ready
+from mov_vader import VaderBatchScorer
+from mov_parallel import score_in_parallel
+from mov_score_cache import ScoreCache, DEFAULT_SCORE_CACHE_PATH
+from mov_normalize import normalize_review, normalize_reviews
+from mov_pipeline import ReviewPipeline
+from mov_aggregate import SentimentAggregator
+from mov_results import ResultStore
+from mov_review_db import ReviewDatabase
+from mov_cli import flag_value, positive_int
+from mov_ingest import default_output_path, run_bulk_ingest
+
+LOAD_MORE_XPATH = "//button[contains(., 'more')]"
+SEE_ALL_XPATH = "//button[contains(., 'all')]"
+REVIEW_CARD_XPATH = "//article[contains(@class, 'user-review-item')]"
+TITLE_XPATH = "//article//h3"
+PAGINATION_KEY_XPATH = "//div[contains(@class, 'load-more-data')]/@data-key"
+USAGE = ("Usage: python mov_nlp_v7.py [--http | --network | --stream] [--lean] [--incremental]\n"
+         "                     [--record PATH | --replay PATH] [--window N] [--keep-history] [--save-db]\n"
+         "                     [--results PATH] [--score-cache] [--workers N]\n"
+         "       python mov_nlp_v7.py --from-db\n"
+         "       python mov_nlp_v7.py [--interactive] [--ingest FILE|- [--ingest-output PATH|-] [--field NAME] [--jsonl]]")
+
+# nltk, requests, lxml and selenium are imported inside the code paths that
+# use them, so the interactive analyzer starts without loading any of them.
+_compiled_xpaths = {}
+
+def compiled_xpath(expression):
+    selector = _compiled_xpaths.get(expression)
+    if selector is None:
+        from lxml import etree
+        selector = _compiled_xpaths[expression] = etree.XPath(expression)
+    return selector
+
+def build_pagination_url(url, pagination_key):
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/') + '/_ajax'
+    return urlunsplit((parts.scheme, parts.netloc, path, urlencode({'paginationKey': pagination_key}), ''))
+
+def scrape_all_reviews_via_http(url, max_reviews=500, session=None, cache=None, limiter=None, watermarks=None,
+                                page_store=None):
+    """
+    Browser-free variant of iter_reviews_with_see_all: follows the review
+    list's load-more pagination key with plain HTTP requests and parses each
+    page with lxml. Returns {'review_id', 'title', 'date'} dicts and stops
+    requesting pages once max_reviews reviews are loaded.
+
+    With a WatermarkStore only reviews newer than the previous run are returned:
+    pagination stops at the first page holding nothing new, and each page is
+    checkpointed together with the reviews loaded so far, so an interrupted
+    scrape resumes from the next page without losing the earlier ones. The
+    caller clears the checkpoint once those reviews have been scored.
+    With a PageStore every fetched page is also kept compressed for re-extraction.
+    """
+    import requests
+    from lxml import html
+    from mov_fetch import fetch, create_session
+    from mov_extract import extract_review_cards
+
+    reviews = []
+    own_session = session is None
+    if own_session:
+        session = create_session(pool_size=1)
+
+    title_id = title_id_from_url(url)
+    page_url = url
+    if watermarks is not None:
+        checkpoint = watermarks.load_checkpoint(title_id)
+        if checkpoint:
+            page_url = checkpoint['next_url']
+            reviews = checkpoint['reviews']
+            print(f"Resuming {title_id} from checkpoint ({len(reviews)} reviews already loaded).")
+
+    try:
+        page_number = 1
+        while page_url and len(reviews) < max_reviews:
+            response, elapsed = fetch(page_url, session=session, timeout=10, cache=cache, limiter=limiter)
+            if page_store is not None:
+                page_store.put(page_url, response.content)
+            tree = html.fromstring(response.content)
+            pagination_keys = compiled_xpath(PAGINATION_KEY_XPATH)(tree)
+            next_url = build_pagination_url(url, pagination_keys[0]) if pagination_keys else None
+
+            cards = extract_review_cards(tree)
+            if not cards:
+                # No review-item markup: fall back to every article heading, without IDs or dates.
+                cards = [{'review_id': None, 'title': element.text_content().strip(), 'date': None}
+                         for element in compiled_xpath(TITLE_XPATH)(tree)]
+            if watermarks is None:
+                page_reviews = [card for card in cards if card['title'] is not None]
+            else:
+                new_cards = watermarks.filter_new(title_id, cards)
+                page_reviews = [card for card in new_cards if card['title'] is not None]
+                loaded = len(reviews) + len(page_reviews)
+                more = bool(new_cards) and next_url is not None and loaded < max_reviews
+                watermarks.commit_page(title_id, new_cards, next_url if more else None, loaded,
+                                       pending=reviews + page_reviews)
+                if cards and not new_cards:
+                    print(f"Page {page_number}: all {len(cards)} reviews were seen in an earlier run. Stopping.")
+                    break
+
+            reviews.extend(page_reviews)
+            print(f"Page {page_number}: {len(page_reviews)} titles in {elapsed * 1000:.0f} ms (total {len(reviews)}).")
+
+            if not page_reviews or next_url is None:
+                break
+            page_url = next_url
+            page_number += 1
+
+        print(f"Extraction complete. {len(reviews)} titles found over {page_number} page(s).")
+        return reviews
+
+    except requests.exceptions.RequestException as err:
+        print(f"❌ Request error: {err}", file=sys.stderr)
+        return reviews
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}", file=sys.stderr)
+        return reviews
+    finally:
+        if own_session:
+            session.close()
+
+def scrape_all_titles_via_http(url, max_reviews=500, session=None, cache=None, limiter=None, watermarks=None,
+                               page_store=None):
+    return [review['title'] for review in
+            scrape_all_reviews_via_http(url, max_reviews, session, cache, limiter, watermarks, page_store)]
+
+COUNT_CARDS_JS = """
+return document.evaluate('count(' + arguments[0] + ')', document, null,
+                         XPathResult.NUMBER_TYPE, null).numberValue;
+"""
+
+# Returns [index, review_id, title, date text] for every card at or after arguments[1] and
+# scrolls the last one into view, so each "Load More" costs one round-trip that
+# only carries the newly appended cards.
+EXTRACT_NEW_CARDS_JS = """
+const snapshot = document.evaluate(arguments[0], document, null,
+                                   XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const cards = [];
+for (let i = arguments[1]; i < snapshot.snapshotLength; i++) {
+    const card = snapshot.snapshotItem(i);
+    const heading = card.querySelector('h3');
+    const date = card.querySelector('.review-date');
+    let reviewId = card.getAttribute('data-review-id');
+    if (!reviewId) {
+        const link = card.querySelector("a[href*='/review/rw']");
+        const match = link ? link.getAttribute('href').match(/rw\\d+/) : null;
+        reviewId = match ? match[0] : null;
+    }
+    cards.push([i, reviewId, heading ? heading.textContent.trim() : null,
+                date ? date.textContent.trim() : null]);
+}
+if (snapshot.snapshotLength > arguments[1]) {
+    snapshot.snapshotItem(snapshot.snapshotLength - 1).scrollIntoView(true);
+}
+return cards;
+"""
+
+def count_review_cards(driver):
+    return int(driver.execute_script(COUNT_CARDS_JS, REVIEW_CARD_XPATH))
+
+def extract_new_cards(driver, offset):
+    return driver.execute_script(EXTRACT_NEW_CARDS_JS, REVIEW_CARD_XPATH, offset)
+
+def wait_for_new_cards(driver, previous_count, button=None, max_wait=15, poll_frequency=0.1):
+    """
+    Waits until the number of review cards exceeds previous_count or the clicked
+    button goes stale (the list was re-rendered), up to max_wait seconds.
+    Returns (fired, seconds_waited).
+    """
+    from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    start = time.perf_counter()
+
+    def cards_grew_or_button_stale(d):
+        if count_review_cards(d) > previous_count:
+            return True
+        if button is not None:
+            try:
+                button.is_enabled()
+            except StaleElementReferenceException:
+                return True
+        return False
+
+    try:
+        WebDriverWait(driver, max_wait, poll_frequency=poll_frequency).until(cards_grew_or_button_stale)
+        fired = True
+    except TimeoutException:
+        fired = False
+    return fired, time.perf_counter() - start
+
+def iter_reviews_with_see_all(url, max_reviews=500, max_wait=15, driver=None, lean=False, watermarks=None):
+    """
+    Generator version of the See all -> Load More scraper. After each page it
+    yields only the newly appended cards as {'index', 'review_id', 'title', 'date'}
+    dicts, so downstream scoring can start before pagination ends and nothing
+    holds the full DOM in Python. A caller-supplied driver (e.g. from a BrowserPool)
+    is reused and left open; otherwise lean=True launches the lean browser profile.
+    With a WatermarkStore, reviews from earlier runs are skipped and pagination
+    stops at the first batch that holds nothing new. Every review yielded so far
+    is kept in the title's checkpoint, and the reviews a previous run left there
+    unscored are yielded first; the caller clears the checkpoint after scoring.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from mov_browser import create_driver
+    from mov_extract import parse_review_date
+
+    own_driver = driver is None
     print("Step 1: Launching browser and loading page...")
     try:
-        service = Service(ChromeDriverManager().install())
-        options = webdriver.ChromeOptions()
-        options.add_argument('--log-level=3') 
-        driver = webdriver.Chrome(service=service, options=options)
+        if own_driver:
+            driver = create_driver(lean=lean)
         driver.get(url)
     except Exception as e:
         print(f"❌ Failed to launch browser. Error: {e}", file=sys.stderr)
-        return []
+        if own_driver and driver is not None:
+            driver.quit()
+        return
     
-    titles = []
-    current_review_count = 0
-    wait = WebDriverWait(driver, 15)
+    offset = 0
+    yielded = 0
+    total_waited = 0.0
+    wait = WebDriverWait(driver, max_wait)
+    title_id = title_id_from_url(url)
+    loaded = []
 
     try:
+        if watermarks is not None:
+            checkpoint = watermarks.load_checkpoint(title_id)
+            if checkpoint and checkpoint['reviews']:
+                print(f"Step 1: {len(checkpoint['reviews'])} reviews from an earlier run are still unscored.")
+                for review in checkpoint['reviews']:
+                    loaded.append(review)
+                    yielded += 1
+                    yield review
+
         print("Step 2: Trying to click 'See all' button...")
         try:
             see_all_button = wait.until(EC.element_to_be_clickable((By.XPATH, SEE_ALL_XPATH)))
+            # The first reviews are already rendered, so wait for more than those.
+            before = count_review_cards(driver)
             see_all_button.click()
             print("Step 2: 'See all' clicked successfully. Waiting for update...")
-            time.sleep(5)
+            fired, waited = wait_for_new_cards(driver, before, button=see_all_button, max_wait=max_wait)
+            total_waited += waited
+            print(f"Step 2: Waited {waited:.2f}s for reviews{'' if fired else ' (timed out)'}.")
         except Exception:
             print("Step 2: 'See all' not found or failed to click. Skipping.")
             pass
 
         print("Step 3: Entering main loop to load more reviews...")
-        while current_review_count < max_reviews:
-            review_elements = driver.find_elements(By.XPATH, REVIEW_CARD_XPATH)
-            new_review_count = len(review_elements)
+        iteration = 0
+        while offset < max_reviews:
+            iteration += 1
+            new_cards = extract_new_cards(driver, offset)
             
-            if new_review_count <= current_review_count and new_review_count > 0:
-                print(f"Step 3: Review count ({new_review_count}) stopped increasing.")
+            if not new_cards and offset > 0:
+                print(f"Step 3: Review count ({offset}) stopped increasing.")
                 break
             
-            if new_review_count > 0:
-                print(f"Step 3: Loaded {new_review_count} reviews so far. Trying to load more...")
-                current_review_count = new_review_count
-                try:
-                    last_review_element = review_elements[-1]
-                    driver.execute_script("arguments[0].scrollIntoView(true);", last_review_element) 
-                    time.sleep(2) 
-                except IndexError:
-                    pass 
+            if new_cards:
+                offset = new_cards[-1][0] + 1
+                print(f"Step 3: Loaded {offset} reviews so far. Trying to load more...")
+                reviews = [{'index': index, 'review_id': review_id, 'title': title,
+                            'date': parse_review_date(date) if date else None}
+                           for index, review_id, title, date in new_cards if title is not None]
+                if watermarks is not None:
+                    unseen = watermarks.filter_new(title_id, reviews)
+                    if reviews and not unseen:
+                        print("Step 3: Reached reviews seen in an earlier run. Stopping.")
+                        break
+                    reviews = unseen
+                for review in reviews:
+                    yielded += 1
+                    yield review
+                if watermarks is not None:
+                    # Marked seen once the consumer has taken the whole batch; the reviews stay in the
+                    # checkpoint until the caller has scored them.
+                    loaded.extend(reviews)
+                    watermarks.commit_page(title_id, reviews, loaded=len(loaded), pending=loaded)
+                if offset >= max_reviews:
+                    break
 
             try:
+                button_start = time.perf_counter()
                 load_more_button = wait.until(EC.element_to_be_clickable((By.XPATH, LOAD_MORE_XPATH)))
+                button_waited = time.perf_counter() - button_start
                 load_more_button.click()
-                time.sleep(4) 
             except Exception:
-                print(f"Step 3: No more 'Load More' button. Total loaded: {current_review_count}.")
+                print(f"Step 3: No more 'Load More' button. Total loaded: {offset}.")
                 break
+
+            fired, waited = wait_for_new_cards(driver, offset, button=load_more_button, max_wait=max_wait)
+            total_waited += button_waited + waited
+            print(f"Step 3: Iteration {iteration} waited {button_waited:.2f}s for button, "
+                  f"{waited:.2f}s for new cards{'' if fired else ' (timed out)'}.")
         
-        print("\nStep 4: Parsing HTML and extracting titles...")
-        tree = html.fromstring(driver.page_source)
-        title_elements = tree.xpath(TITLE_XPATH)
-        for element in title_elements:
-            titles.append(element.text_content().strip())
-        
-        print(f"Step 5: Extraction complete. {len(titles)} titles found. Closing browser.")
-        return titles
+        print(f"Step 3: Total time spent waiting: {total_waited:.2f}s.")
+        print(f"Step 4: Extraction complete. {yielded} titles found. Closing browser.")
+
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}", file=sys.stderr)
+    finally:
+        if own_driver:
+            driver.quit()
+
+def scrape_all_titles_with_see_all(url, max_reviews=500, max_wait=15, driver=None, lean=False, watermarks=None):
+    return [review['title'] for review in
+            iter_reviews_with_see_all(url, max_reviews, max_wait, driver, lean, watermarks)]
+
+def scrape_many_with_see_all(urls, max_reviews=500, max_wait=15, pool_size=4, max_uses=20, lean=True):
+    """
+    Scrapes several titles in parallel over a pool of at most pool_size headless
+    browsers that are reused across titles. Returns {url: [titles]}.
+    """
+    from mov_browser import BrowserPool
+
+    urls = list(urls)
+
+    with BrowserPool(size=pool_size, max_uses=max_uses, lean=lean) as pool:
+        def scrape_one(url):
+            with pool.checkout() as driver:
+                return scrape_all_titles_with_see_all(url, max_reviews, max_wait, driver=driver)
+
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            results = dict(zip(urls, executor.map(scrape_one, urls)))
+        print(f"Browser pool: {pool.stats()}")
+    return results
+
+NEXT_DATA_JS = """
+const node = document.getElementById('__NEXT_DATA__');
+return node ? node.textContent : null;
+"""
+
+def review_title_from_record(record):
+    for key in ('summary', 'reviewSummary', 'title'):
+        value = record.get(key)
+        if isinstance(value, dict):
+            value = value.get('originalText') or value.get('plainText')
+        if isinstance(value, str):
+            return value.strip()
+    return None
+
+def find_review_records(payload):
+    """
+    Walks a decoded JSON payload and returns every review record in document
+    order as {'review_id', 'title'} dicts. A record is any object whose 'id' or
+    'reviewId' is an IMDb review ID ('rw...') and that carries a summary/title.
+    """
+    records = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            review_id = node.get('id') or node.get('reviewId')
+            if isinstance(review_id, str) and review_id.startswith('rw'):
+                title = review_title_from_record(node)
+                if title is not None:
+                    records.append({'review_id': review_id, 'title': title})
+                    continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return records
+
+def read_network_json(driver, pending):
+    """
+    Drains Chrome's performance log and returns the decoded bodies of finished
+    XHR/fetch JSON responses. `pending` maps request IDs seen in
+    Network.responseReceived to their URL; bodies that are not finished yet
+    stay in it for the next call.
+    """
+    finished = set()
+    for entry in driver.get_log('performance'):
+        message = json.loads(entry['message'])['message']
+        params = message.get('params', {})
+        if message.get('method') == 'Network.responseReceived':
+            response = params.get('response', {})
+            if params.get('type') in ('XHR', 'Fetch') and 'json' in response.get('mimeType', ''):
+                pending[params['requestId']] = response.get('url')
+        elif message.get('method') == 'Network.loadingFinished':
+            finished.add(params.get('requestId'))
+
+    payloads = []
+    for request_id in [request_id for request_id in pending if request_id in finished]:
+        url = pending.pop(request_id)
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            text = base64.b64decode(body['body']).decode('utf-8') if body.get('base64Encoded') else body['body']
+            payloads.append(json.loads(text))
+        except Exception as e:
+            print(f"    Skipping unreadable response from {url}: {e}", file=sys.stderr)
+    return payloads
+
+def iter_reviews_from_network_log(url, max_reviews=500, max_wait=15, driver=None, lean=False):
+    """
+    Variant of iter_reviews_with_see_all that reads review records from the JSON
+    the page itself loads (__NEXT_DATA__ for the first page, XHR/fetch responses
+    captured in Chrome's performance log after each "Load More") instead of
+    walking the rendered DOM. Yields {'review_id', 'title'} dicts, deduplicated
+    by review ID. A caller-supplied driver must have been created with
+    network_log=True.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from mov_browser import create_driver
+
+    own_driver = driver is None
+    print("Step 1: Launching browser and loading page...")
+    try:
+        if own_driver:
+            driver = create_driver(lean=lean, network_log=True)
+        driver.get(url)
+    except Exception as e:
+        print(f"❌ Failed to launch browser. Error: {e}", file=sys.stderr)
+        if own_driver and driver is not None:
+            driver.quit()
+        return
+
+    seen_ids = set()
+    pending = {}
+    wait = WebDriverWait(driver, max_wait)
+
+    def unseen(records):
+        for record in records:
+            if record['review_id'] not in seen_ids:
+                seen_ids.add(record['review_id'])
+                yield record
+
+    try:
+        next_data = driver.execute_script(NEXT_DATA_JS)
+        if next_data:
+            initial = find_review_records(json.loads(next_data))
+        else:
+            initial = [{'review_id': review_id, 'title': title}
+                       for _, review_id, title, _ in extract_new_cards(driver, 0) if review_id and title]
+        read_network_json(driver, pending)
+        print(f"Step 2: {len(initial)} reviews embedded in the initial page.")
+        yield from unseen(initial)
+
+        iteration = 0
+        while len(seen_ids) < max_reviews:
+            iteration += 1
+            card_count = count_review_cards(driver)
+            try:
+                load_more_button = wait.until(EC.element_to_be_clickable((By.XPATH, LOAD_MORE_XPATH)))
+                load_more_button.click()
+            except Exception:
+                print(f"Step 3: No more 'Load More' button. Total loaded: {len(seen_ids)}.")
+                break
+            wait_for_new_cards(driver, card_count, button=load_more_button, max_wait=max_wait)
+
+            deadline = time.perf_counter() + max_wait
+            new_records = []
+            while True:
+                for payload in read_network_json(driver, pending):
+                    new_records.extend(unseen(find_review_records(payload)))
+                if new_records or not pending or time.perf_counter() > deadline:
+                    break
+                time.sleep(0.1)
+
+            if not new_records:
+                print(f"Step 3: No new review records after iteration {iteration}.")
+                break
+            print(f"Step 3: Iteration {iteration} captured {len(new_records)} reviews (total {len(seen_ids)}).")
+            yield from new_records
+
+        print(f"Step 4: Extraction complete. {len(seen_ids)} unique reviews captured. Closing browser.")
 
     except Exception as e:
         print(f"❌ Unexpected error: {e}", file=sys.stderr)
-        return []
     finally:
-        driver.quit()
+        if own_driver:
+            driver.quit()
 
 def ensure_nltk_data():
+    import nltk
+
     try:
         nltk.data.find('sentiment/vader_lexicon.zip')
     except nltk.downloader.DownloadError:
@@ -97,19 +499,21 @@ def ensure_nltk_data():
         nltk.download('vader_lexicon')
 
 def preprocess_review(review):
-    review = re.sub(r'^\s*[\d\.\)]+\s*(\*\*|\*|)\s*', '', review).strip()
-    review = re.sub(r'[\*\`\#]+', '', review)
-    return review.strip()
+    return normalize_review(review)
 
 def calculate_and_print_summary(history, title="COMPREHENSIVE MOVIE REVIEW SUMMARY"):
-    if not history:
+    # `history` is a list of labels, or a SentimentAggregator / ResultStore that counts itself.
+    counts = history.counts() if hasattr(history, "counts") else Counter(history)
+    print_summary_from_counts(counts, title=title)
+
+def print_summary_from_counts(counts, title="COMPREHENSIVE MOVIE REVIEW SUMMARY"):
+    total = sum(counts.values())
+    if not total:
         print(f"\n[ {title} ]")
         print("No reviews entered yet.")
         print("-" * 60)
         return
 
-    counts = Counter(history)
-    total = len(history)
     pos_count = counts.get('Positive', 0)
     neg_count = counts.get('Negative', 0)
     neu_count = counts.get('Neutral', 0)
@@ -132,16 +536,33 @@ def calculate_and_print_summary(history, title="COMPREHENSIVE MOVIE REVIEW SUMMA
     print(f"Movie Assessment: {overall_sentiment}")
     print("=" * 60)
 
-def run_batch_analysis(sid, reviews):
-    batch_history = []
+def print_aggregate_summary(aggregator, title="COMPREHENSIVE MOVIE REVIEW SUMMARY"):
+    summary = aggregator.summary()
+    print_summary_from_counts(summary['counts'], title=title)
+    if summary['total']:
+        print(f"Compound Score: mean {summary['compound_mean']:+.4f}, std dev {summary['compound_stdev']:.4f}")
+        window = summary.get('window')
+        if window is not None:
+            counts = window['counts']
+            print(f"Recent Window ({window['total']} reviews): {counts.get('Positive', 0)} positive / "
+                  f"{counts.get('Negative', 0)} negative / {counts.get('Neutral', 0)} neutral, "
+                  f"mean {window['compound_mean']:+.4f}")
+        print("-" * 60)
+
+def run_batch_analysis(scorer, reviews, cache=None, aggregator=None, results=None, database=None, title_id=None,
+                       review_ids=None, dates=None):
+    aggregator = aggregator if aggregator is not None else SentimentAggregator()
+    labels = []
     print("\n" + "#" * 60)
     print("           AUTOMATIC BATCH ANALYSIS STARTED             ")
     print("#" * 60)
     
-    for i, raw_review in enumerate(reviews):
-        review = preprocess_review(raw_review)
-        scores = sid.polarity_scores(review)
-        compound_score = scores['compound']
+    cleaned_reviews = normalize_reviews(reviews)
+    scores = (cache or scorer).score_many(cleaned_reviews)
+    compound_scores = scores['compound']
+    
+    for i, (raw_review, review) in enumerate(zip(reviews, cleaned_reviews)):
+        compound_score = float(compound_scores[i])
         
         if compound_score >= 0.05:
             sentiment = "Positive"
@@ -150,31 +571,72 @@ def run_batch_analysis(sid, reviews):
         else:
             sentiment = "Neutral"
         
-        batch_history.append(sentiment)
+        aggregator.add(sentiment, compound_score)
+        labels.append(sentiment)
         print(f"Review {i+1} (Processed: '{review[:30]}...'): '{raw_review[:40]}...' -> Classification: {sentiment} (Compound: {compound_score:.4f})")
 
-    calculate_and_print_summary(batch_history, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
-    return batch_history
+    if results is not None:
+        results.extend(labels, scores, texts=cleaned_reviews)
+    if database is not None:
+        database.save_reviews(title_id, reviews, cleaned_reviews, scores, labels, review_ids=review_ids, dates=dates)
+    print_aggregate_summary(aggregator, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
+    return aggregator
+
+def run_parallel_batch_analysis(reviews, workers=None, aggregator=None):
+    aggregator = aggregator if aggregator is not None else SentimentAggregator()
+    print("\n" + "#" * 60)
+    print("           AUTOMATIC BATCH ANALYSIS STARTED             ")
+    print(f"        (parallel mode, {workers or os.cpu_count()} worker processes)")
+    print("#" * 60)
+
+    labels, compounds, _ = score_in_parallel(reviews, preprocess=preprocess_review, workers=workers)
+    aggregator.add_many(labels, compounds.tolist())
+    print_aggregate_summary(aggregator, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
+    return aggregator
+
+def run_streaming_analysis(source, cache=None, aggregator=None):
+    aggregator = aggregator if aggregator is not None else SentimentAggregator()
+    print("\n" + "#" * 60)
+    print("           STREAMING ANALYSIS STARTED             ")
+    print("#" * 60)
+
+    pipeline = ReviewPipeline(source, scorer=cache, aggregate=aggregator.add_many)
+    pipeline.run()
+    pipeline.print_report()
+    print_aggregate_summary(aggregator, title="BATCH ANALYSIS SUMMARY (Scraped Reviews)")
+    return aggregator
 
-def run_interactive_analyzer(sid, initial_history):
-    analysis_history = initial_history.copy()
+def run_interactive_analyzer(scorer, aggregator, cache=None, results=None):
     print("=" * 60)
     print("         INTERACTIVE ANALYSIS MODE ACTIVATED          ")
     print("=" * 60)
     print("Please enter your movie review (English is highly recommended).")
     print("Type 'result' for a summary of all reviews so far.")
+    print("Type ':ingest <file or -> [output.jsonl]' to score a whole file or stdin in bulk.")
     print("Type 'exit' or 'quit' to end the program.")
     print("-" * 60)
 
     while True:
-        review = input(">>> Enter review: ")
+        try:
+            review = input(">>> Enter review: ")
+        except EOFError:
+            review = "exit"
         
         if review.lower() == 'result':
-            calculate_and_print_summary(analysis_history, title="CUMULATIVE REVIEW SUMMARY")
+            print_aggregate_summary(aggregator, title="CUMULATIVE REVIEW SUMMARY")
+            continue
+
+        parts = review.split()
+        if parts and parts[0].lower() == ':ingest':
+            if len(parts) in (2, 3):
+                output_path = parts[2] if len(parts) == 3 else default_output_path(parts[1])
+                run_bulk_ingest(scorer, parts[1], output_path, aggregator, print_summary=print_aggregate_summary)
+            else:
+                print("Usage: :ingest <file or -> [output.jsonl]")
             continue
         
         if review.lower() in ['exit', 'quit']:
-            calculate_and_print_summary(analysis_history, title="FINAL CUMULATIVE SUMMARY")
+            print_aggregate_summary(aggregator, title="FINAL CUMULATIVE SUMMARY")
             print("-" * 60)
             print("Thank you for using the analyzer. Program terminated.")
             break
@@ -184,7 +646,7 @@ def run_interactive_analyzer(sid, initial_history):
 
         try:
             cleaned_review = preprocess_review(review)
-            scores = sid.polarity_scores(cleaned_review)
+            scores = (cache or scorer).polarity_scores(cleaned_review)
             compound_score = scores['compound']
             
             if compound_score >= 0.05:
@@ -194,7 +656,9 @@ def run_interactive_analyzer(sid, initial_history):
             else:
                 sentiment = "Neutral"
             
-            analysis_history.append(sentiment)
+            aggregator.add(sentiment, compound_score)
+            if results is not None:
+                results.append(sentiment, scores, text=cleaned_review)
 
             print(f"\n[ Analysis Result ]")
             print(f"  Sentiment Classification: {sentiment}")
@@ -208,11 +672,61 @@ def run_interactive_analyzer(sid, initial_history):
 
 if __name__ == "__main__":
     target_url = "https://www.imdb.com/title/tt7817340/reviews/?ref_=tt_ov_ururv"
-    print("--- IMDb All Review Titles Scraper (See all -> Load More Strategy) ---")
-    all_titles = scrape_all_titles_with_see_all(target_url, max_reviews=50) 
+    # Option values are checked before anything is scraped or scored.
+    window_size = flag_value(sys.argv, "--window", positive_int, usage=USAGE)
+    results_path = flag_value(sys.argv, "--results", usage=USAGE)
+    workers = flag_value(sys.argv, "--workers", positive_int, usage=USAGE)
+    ingest_source = flag_value(sys.argv, "--ingest", usage=USAGE)
+    ingest_output = flag_value(sys.argv, "--ingest-output", usage=USAGE)
+    field = flag_value(sys.argv, "--field", usage=USAGE)
+    if "--from-db" in sys.argv:
+        print_aggregate_summary(ReviewDatabase().for_title(title_id_from_url(target_url)),
+                                title="STORED REVIEW SUMMARY (No Rescoring)")
+        sys.exit(0)
+    if "--interactive" in sys.argv or ingest_source is not None:
+        # Fast start: no scraper imports, lexicon read from the binary cache.
+        if not lexicon_cache_ready():
+            ensure_nltk_data()
+        scorer = VaderBatchScorer()
+        aggregator = SentimentAggregator()
+        if ingest_source is not None:
+            # Bulk mode: --ingest FILE|- [--ingest-output PATH|-] [--field NAME] [--jsonl]
+            run_bulk_ingest(scorer, ingest_source, ingest_output or default_output_path(ingest_source), aggregator,
+                            field=field, jsonl=True if "--jsonl" in sys.argv else None,
+                            print_summary=print_aggregate_summary)
+        if "--interactive" in sys.argv:
+            run_interactive_analyzer(scorer, aggregator, cache=ScoreCache(scorer))
+        sys.exit(0)
+    watermarks = WatermarkStore() if "--incremental" in sys.argv else None
+    stream_source = None
+    if "--stream" in sys.argv:
+        print("--- IMDb All Review Titles Scraper (Streaming: scrape -> clean -> score) ---")
+        if "--network" in sys.argv:
+            reviews = iter_reviews_from_network_log(target_url, max_reviews=50, lean="--lean" in sys.argv)
+        else:
+            reviews = iter_reviews_with_see_all(target_url, max_reviews=50, lean="--lean" in sys.argv,
+                                                watermarks=watermarks)
+        stream_source = (review['title'] for review in reviews)
+        all_reviews = []
+    elif "--http" in sys.argv:
+        print("--- IMDb All Review Titles Scraper (HTTP Pagination Strategy) ---")
+        from mov_archive import session_from_argv
+        all_reviews = scrape_all_reviews_via_http(target_url, max_reviews=50, session=session_from_argv(sys.argv),
+                                                  watermarks=watermarks)
+    elif "--network" in sys.argv:
+        print("--- IMDb All Review Titles Scraper (Network Log Strategy) ---")
+        all_reviews = list(iter_reviews_from_network_log(target_url, max_reviews=50, lean="--lean" in sys.argv))
+    else:
+        print("--- IMDb All Review Titles Scraper (See all -> Load More Strategy) ---")
+        all_reviews = list(iter_reviews_with_see_all(target_url, max_reviews=50, lean="--lean" in sys.argv,
+                                                     watermarks=watermarks))
+    # Scoring works on the titles; the review IDs and dates go to the review database.
+    all_titles = [review['title'] for review in all_reviews]
     print("-------------------------------------------------------")
 
-    if all_titles:
+    if stream_source is not None:
+        print("Streaming mode: reviews are scored while the scraper is still running.")
+    elif all_titles:
         print(f"Fetched {len(all_titles)} review titles successfully.")
         print("\n**First 10 Review Titles:**")
         for i, title in enumerate(all_titles[:10]):
@@ -221,7 +735,31 @@ if __name__ == "__main__":
         print("No review titles were fetched.")
     print("-------------------------------------------------------")
 
-    ensure_nltk_data()
-    sid = SentimentIntensityAnalyzer()
-    initial_history = run_batch_analysis(sid, all_titles)
-    run_interactive_analyzer(sid, initial_history)
+    if not lexicon_cache_ready():
+        ensure_nltk_data()
+    scorer = VaderBatchScorer()
+    aggregator = SentimentAggregator(
+        window_size=window_size,
+        keep_history="--keep-history" in sys.argv)
+    review_db = ReviewDatabase() if "--save-db" in sys.argv else None
+    # Per-review rows are only kept when asked for; the aggregator holds the running summary.
+    results = ResultStore(results_path) if results_path else None
+    score_cache = ScoreCache(scorer, path=DEFAULT_SCORE_CACHE_PATH if "--score-cache" in sys.argv else None)
+    if stream_source is not None:
+        run_streaming_analysis(stream_source, cache=score_cache, aggregator=aggregator)
+    elif workers is not None:
+        run_parallel_batch_analysis(all_titles, workers=workers, aggregator=aggregator)
+    else:
+        run_batch_analysis(scorer, all_titles, cache=score_cache, aggregator=aggregator, results=results,
+                           database=review_db, title_id=title_id_from_url(target_url),
+                           review_ids=[review.get('review_id') for review in all_reviews],
+                           dates=[review.get('date') for review in all_reviews])
+        print(f"Score cache: {score_cache.stats()}")
+        if results is not None:
+            print(f"Result store: {results.stats()}")
+    if watermarks is not None:
+        # The scraped titles are scored now, so the checkpoint holding them can go.
+        watermarks.clear_checkpoint(title_id_from_url(target_url))
+    run_interactive_analyzer(scorer, aggregator, cache=score_cache, results=results)
+    if results is not None:
+        results.close()
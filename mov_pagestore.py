@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+import zlib
+from collections import Counter
+
+from mov_archive import PageArchive
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_DICT_SIZE = 110 * 1024
+ZLIB_DICT_SIZE = 32 * 1024
+MIN_SEGMENT_LENGTH = 8
+
+
+def train_zlib_dictionary(samples, dict_size=ZLIB_DICT_SIZE):
+    """
+    Builds a zlib preset dictionary from the markup segments that recur across
+    sample pages. zlib only looks back 32 KiB and favours the end of the
+    dictionary, so the most valuable segments are placed last.
+    """
+    counts = Counter()
+    for sample in samples:
+        counts.update(set(segment + b">" for segment in sample.split(b">") if len(segment) >= MIN_SEGMENT_LENGTH))
+
+    chosen = []
+    size = 0
+    for segment, count in sorted(counts.items(), key=lambda item: item[1] * len(item[0]), reverse=True):
+        if count < 2:
+            break
+        if size + len(segment) > dict_size:
+            continue
+        chosen.append(segment)
+        size += len(segment)
+    return b"".join(reversed(chosen))
+
+
+def train_dictionary(samples, codec=None, dict_size=DEFAULT_DICT_SIZE):
+    """Trains a shared dictionary from sample pages; returns (codec, dictionary_bytes)."""
+    samples = list(samples)
+    codec = codec or ("zstd" if zstandard is not None else "zlib")
+    if codec == "zstd":
+        return codec, zstandard.train_dictionary(dict_size, samples).as_bytes()
+    return codec, train_zlib_dictionary(samples, min(dict_size, ZLIB_DICT_SIZE))
+
+
+class PageStore(PageArchive):
+    """
+    Raw review page store compressed with a shared dictionary.
+
+    IMDb pages are mostly identical boilerplate, so compressing every page
+    against one dictionary trained on sample pages stores far less than
+    compressing each page on its own. Pages stay randomly accessible by URL
+    through the archive index. The codec ('zstd' when the zstandard package is
+    installed, otherwise zlib with a preset dictionary) and the dictionary are
+    fixed when the store is created and saved in `<path>.meta` / `<path>.dict`.
+    zstd compressor objects are not thread-safe, so every thread that puts or
+    reads pages gets its own (fetch_many workers call put concurrently).
+    """
+
+    def __init__(self, path, samples=None, codec=None, level=None):
+        self.meta_path = path + ".meta"
+        self.dict_path = path + ".dict"
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self.dict_path, "rb") as f:
+                dictionary = f.read()
+        elif samples is not None:
+            codec, dictionary = train_dictionary(samples, codec)
+            meta = {'codec': codec, 'level': level or 9}
+            with open(self.dict_path, "wb") as f:
+                f.write(dictionary)
+            with open(self.meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        else:
+            raise ValueError(f"{path} has no dictionary yet; pass sample pages to train one")
+
+        self.codec = meta['codec']
+        self.level = meta['level']
+        self.dictionary = dictionary
+        self.codecs = threading.local()
+        if self.codec == "zstd" and zstandard is None:
+            raise ImportError(f"{path} was written with zstd; install the 'zstandard' package to read it")
+        super().__init__(path)
+
+    def _zstd(self):
+        """This thread's (compressor, decompressor) pair, created on first use."""
+        pair = getattr(self.codecs, "zstd", None)
+        if pair is None:
+            zstd_dict = zstandard.ZstdCompressionDict(self.dictionary)
+            pair = self.codecs.zstd = (zstandard.ZstdCompressor(level=self.level, dict_data=zstd_dict),
+                                       zstandard.ZstdDecompressor(dict_data=zstd_dict))
+        return pair
+
+    def compress(self, body):
+        if self.codec == "zstd":
+            return self._zstd()[0].compress(body)
+        compressor = zlib.compressobj(self.level, zdict=self.dictionary)
+        return compressor.compress(body) + compressor.flush()
+
+    def decompress(self, blob):
+        if self.codec == "zstd":
+            return self._zstd()[1].decompress(blob)
+        decompressor = zlib.decompressobj(zdict=self.dictionary)
+        return decompressor.decompress(blob) + decompressor.flush()
+
+    def put(self, url, body, status=200, headers=None):
+        return self.append(url, status, headers or {}, body, 0.0)
+
+    def get_page(self, url):
+        record = self.get(url)
+        return record[1] if record else None
+
+    def stats(self):
+        stats = super().stats()
+        stats['codec'] = self.codec
+        stats['dict_bytes'] = len(self.dictionary)
+        stats['ratio'] = stats['raw_bytes'] / stats['stored_bytes'] if stats['stored_bytes'] else 0.0
+        return stats
@@ -0,0 +1,105 @@
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from mov_labels import label_for_compound
+from mov_lexicon import DEFAULT_MAPPED_LEXICON_PATH, ensure_mapped_lexicon, load_mapped_tables
+from mov_vader import VaderBatchScorer
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Per-process state, set once by init_worker when the pool starts the worker.
+_scorer = None
+_preprocess = None
+
+
+def init_worker(preprocess=None, mapped_lexicon=None):
+    global _scorer, _preprocess
+    _scorer = VaderBatchScorer(tables=load_mapped_tables(mapped_lexicon) if mapped_lexicon else None)
+    _preprocess = preprocess
+
+
+def score_chunk(reviews):
+    """Scores one chunk in a worker; returns (labels, compound scores, label Counter)."""
+    cleaned = [_preprocess(review) for review in reviews] if _preprocess else reviews
+    compounds = _scorer.score_many(cleaned)['compound']
+    labels = [label_for_compound(compound) for compound in compounds.tolist()]
+    return labels, compounds, Counter(labels)
+
+
+def iter_chunks(items, chunk_size=DEFAULT_CHUNK_SIZE):
+    for start in range(0, len(items), chunk_size):
+        yield items[start:start + chunk_size]
+
+
+def score_in_parallel(reviews, preprocess=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                      mapped_lexicon=DEFAULT_MAPPED_LEXICON_PATH):
+    """
+    Splits reviews into chunks and scores them on a process pool.
+
+    Each worker builds its scorer once, in the pool initializer, and reuses it
+    for every chunk it receives. Pool workers look words up in the memory-mapped
+    lexicon at `mapped_lexicon` (built once here), so they share one copy of it
+    instead of each loading its own dict; None gives every worker its own
+    dict from the marshal cache. `preprocess` must be a module-level function
+    so it can be sent to the workers. Results come back in input order as
+    (labels, compound scores, combined label Counter).
+    """
+    reviews = list(reviews)
+    workers = workers or os.cpu_count() or 1
+    labels = []
+    compounds = []
+    counts = Counter()
+
+    if workers == 1 or len(reviews) <= chunk_size:
+        init_worker(preprocess)
+        results = map(score_chunk, iter_chunks(reviews, chunk_size))
+        for chunk_labels, chunk_compounds, chunk_counts in results:
+            labels.extend(chunk_labels)
+            compounds.append(chunk_compounds)
+            counts.update(chunk_counts)
+    else:
+        if mapped_lexicon:
+            ensure_mapped_lexicon(mapped_lexicon)
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(preprocess, mapped_lexicon)) as executor:
+            for chunk_labels, chunk_compounds, chunk_counts in executor.map(score_chunk, iter_chunks(reviews, chunk_size)):
+                labels.extend(chunk_labels)
+                compounds.append(chunk_compounds)
+                counts.update(chunk_counts)
+
+    compounds = np.concatenate(compounds) if compounds else np.empty(0)
+    return labels, compounds, counts
+
+
+if __name__ == "__main__":
+    import sys
+    from bench_vader import synthetic_reviews
+
+    # Usage: python mov_parallel.py [worker_count ...]   (default: 1, 2, 4 and all CPUs)
+    reviews = synthetic_reviews(200_000)
+    cpu_count = os.cpu_count() or 1
+    if len(sys.argv) > 1:
+        worker_counts = [int(arg) for arg in sys.argv[1:]]
+    else:
+        worker_counts = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print("\n" + "=" * 60)
+    print(f"{'PARALLEL BATCH SCORING BENCHMARK':^60}")
+    print("=" * 60)
+    print(f"Reviews: {len(reviews):,}, CPUs: {cpu_count}, chunk size: {DEFAULT_CHUNK_SIZE}")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        labels, compounds, counts = score_in_parallel(reviews, workers=workers)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = (elapsed, labels)
+        speedup = baseline[0] / elapsed
+        print(f"  - {workers:2d} worker(s): {len(reviews) / elapsed:>9,.0f} reviews/s  "
+              f"speedup {speedup:4.2f}x  same labels: {labels == baseline[1]}")
+    print(f"Label counts: {dict(counts)}")
+    print("=" * 60)
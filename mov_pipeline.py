@@ -0,0 +1,238 @@
+import queue
+import threading
+import time
+from collections import Counter
+
+from mov_normalize import normalize_reviews
+from mov_labels import label_for_compound
+from mov_vader import VaderBatchScorer
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_QUEUE_SIZE = 8
+_DONE = object()
+
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.starved_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.depth_samples = 0
+        self.depth_total = 0
+        self.max_depth = 0
+
+    def sample_depth(self, depth):
+        self.depth_samples += 1
+        self.depth_total += depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def as_dict(self):
+        return {
+            'items': self.items, 'batches': self.batches,
+            'items_per_sec': round(self.items / self.busy_seconds) if self.busy_seconds else 0,
+            'busy_seconds': round(self.busy_seconds, 3), 'starved_seconds': round(self.starved_seconds, 3),
+            'blocked_seconds': round(self.blocked_seconds, 3),
+            'avg_queue_depth': round(self.depth_total / self.depth_samples, 2) if self.depth_samples else 0.0,
+            'max_queue_depth': self.max_depth,
+        }
+
+
+class ReviewPipeline:
+    """
+    Streaming fetch -> clean -> score -> aggregate pipeline.
+
+    Each stage runs in its own thread and hands batches of `batch_size`
+    reviews to the next through a queue holding at most `queue_size`
+    batches, so a slow stage makes the ones before it wait instead of
+    buffering the whole corpus. Fetching (I/O) overlaps with scoring, and
+    memory stays bounded by the queues whatever the corpus size.
+
+    `source` is any iterable of raw review titles (a scraper generator, for
+    example). `scorer` needs a score_many(texts) method: VaderBatchScorer or
+    ScoreCache. `aggregate(labels, compounds)` is called once per scored batch
+    from the last stage; by default only the label counts are kept.
+
+    stats() reports per-stage items, throughput while busy, time spent
+    starved (waiting for input) or blocked (waiting for queue space) and the
+    depth of the queue feeding each stage.
+    """
+
+    def __init__(self, source, scorer=None, batch_size=DEFAULT_BATCH_SIZE, queue_size=DEFAULT_QUEUE_SIZE,
+                 normalize=normalize_reviews, aggregate=None):
+        self.source = source
+        self.scorer = scorer or VaderBatchScorer()
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self.counts = Counter()
+        self.aggregate = aggregate or self.count_labels
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in range(3)]
+        self.stages = {name: StageStats(name) for name in ("fetch", "clean", "score", "aggregate")}
+        self.stop = threading.Event()
+        self.error = None
+        self.elapsed = 0.0
+
+    def count_labels(self, labels, compounds):
+        self.counts.update(labels)
+
+    def _put(self, stage, outbox, item):
+        start = time.perf_counter()
+        while not self.stop.is_set():
+            try:
+                outbox.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        stage.blocked_seconds += time.perf_counter() - start
+
+    def _get(self, inbox):
+        while not self.stop.is_set():
+            try:
+                return inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fail(self, err):
+        if self.error is None:
+            self.error = err
+        self.stop.set()
+
+    def _fetch(self, outbox):
+        stage = self.stages["fetch"]
+        batch = []
+        try:
+            iterator = iter(self.source)
+            while not self.stop.is_set():
+                start = time.perf_counter()
+                review = next(iterator, _DONE)
+                stage.busy_seconds += time.perf_counter() - start
+                if review is _DONE:
+                    break
+                batch.append(review)
+                if len(batch) >= self.batch_size:
+                    stage.items += len(batch)
+                    stage.batches += 1
+                    self._put(stage, outbox, batch)
+                    batch = []
+            if batch:
+                stage.items += len(batch)
+                stage.batches += 1
+                self._put(stage, outbox, batch)
+        except Exception as err:
+            self._fail(err)
+        finally:
+            self._put(stage, outbox, _DONE)
+
+    def _run_stage(self, stage, func, inbox, outbox=None, size=len):
+        try:
+            while True:
+                start = time.perf_counter()
+                stage.sample_depth(inbox.qsize())
+                batch = self._get(inbox)
+                stage.starved_seconds += time.perf_counter() - start
+                if batch is _DONE:
+                    break
+                start = time.perf_counter()
+                result = func(batch)
+                stage.busy_seconds += time.perf_counter() - start
+                stage.items += size(batch)
+                stage.batches += 1
+                if outbox is not None:
+                    self._put(stage, outbox, result)
+        except Exception as err:
+            self._fail(err)
+        finally:
+            if outbox is not None:
+                self._put(stage, outbox, _DONE)
+
+    def _score(self, texts):
+        compounds = self.scorer.score_many(texts)['compound'].tolist()
+        return [label_for_compound(compound) for compound in compounds], compounds
+
+    def _aggregate(self, scored):
+        self.aggregate(*scored)
+
+    def run(self):
+        """Runs the pipeline to completion and returns the label Counter; re-raises a stage's error."""
+        start = time.perf_counter()
+        fetched, cleaned, scored = self.queues
+        threads = [
+            threading.Thread(target=self._fetch, args=(fetched,), name="pipeline-fetch", daemon=True),
+            threading.Thread(target=self._run_stage, args=(self.stages["clean"], self.normalize, fetched, cleaned),
+                             name="pipeline-clean", daemon=True),
+            threading.Thread(target=self._run_stage, args=(self.stages["score"], self._score, cleaned, scored),
+                             name="pipeline-score", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        self._run_stage(self.stages["aggregate"], self._aggregate, scored, size=lambda labelled: len(labelled[0]))
+        for thread in threads:
+            thread.join()
+        self.elapsed = time.perf_counter() - start
+        if self.error is not None:
+            raise self.error
+        return self.counts
+
+    def stats(self):
+        return {name: stage.as_dict() for name, stage in self.stages.items()}
+
+    def print_report(self, title="STREAMING PIPELINE REPORT"):
+        print("\n" + "=" * 60)
+        print(f"{title:^60}")
+        print("=" * 60)
+        total = self.stages["aggregate"].items
+        print(f"Reviews: {total}, wall time {self.elapsed:.2f}s"
+              f" ({total / self.elapsed if self.elapsed else 0:,.0f} reviews/s end to end)")
+        for name, stats in self.stats().items():
+            print(f"  - {name:9s} {stats['items_per_sec']:>9,} items/s busy {stats['busy_seconds']:6.2f}s"
+                  f"  starved {stats['starved_seconds']:6.2f}s  blocked {stats['blocked_seconds']:6.2f}s"
+                  f"  queue avg {stats['avg_queue_depth']:4.1f} max {stats['max_queue_depth']}")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    import tracemalloc
+
+    from mov_extract import extract_titles
+    from mov_fetch import create_session, fetch, review_url
+    from mov_fixture_server import start_fixture_server
+
+    # 200 titles x 100 reviews behind a 20 ms server, fetched one page at a
+    # time; compares the staged flow (scrape everything, then score) with the
+    # streaming pipeline on wall time and peak traced memory.
+    server = start_fixture_server(latency=0.02, reviews_per_page=100)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    title_ids = [f"tt{7817340 + i:07d}" for i in range(200)]
+    scorer = VaderBatchScorer()
+
+    def iter_titles(session):
+        for title_id in title_ids:
+            response, _ = fetch(review_url(title_id, base_url), session=session)
+            yield from extract_titles(response.content)
+
+    def staged():
+        all_titles = list(iter_titles(create_session()))
+        compounds = scorer.score_many(normalize_reviews(all_titles))['compound'].tolist()
+        return Counter(label_for_compound(compound) for compound in compounds)
+
+    def streaming():
+        pipeline = ReviewPipeline(iter_titles(create_session()), scorer=scorer)
+        return pipeline.run(), pipeline
+
+    results = {}
+    for label, func in (("staged", staged), ("streaming", streaming)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        results[label] = func()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{label:10s} {elapsed:6.2f}s  peak traced memory {peak / 2**20:6.1f} MiB")
+
+    counts, pipeline = results["streaming"]
+    print(f"Same label counts: {counts == results['staged']} {dict(counts)}")
+    pipeline.print_report()
+    server.shutdown()
@@ -0,0 +1,252 @@
+import json
+import os
+from collections import Counter
+
+import numpy as np
+
+LABEL_CODES = {"Negative": -1, "Neutral": 0, "Positive": 1}
+LABEL_NAMES = {code: label for label, code in LABEL_CODES.items()}
+COLUMNS = {'label': np.int8, 'neg': np.float32, 'neu': np.float32, 'pos': np.float32,
+           'compound': np.float32, 'text_id': np.int32}
+DEFAULT_CHUNK_ROWS = 64 * 1024
+NO_TEXT = -1
+
+
+class Column:
+    """One growable NumPy column, in memory or in a memory-mapped file extended chunk by chunk."""
+
+    def __init__(self, dtype, chunk_rows, path=None, length=0):
+        self.dtype = np.dtype(dtype)
+        self.chunk_rows = chunk_rows
+        self.path = path
+        self.length = length
+        self.data = np.empty(0, dtype=self.dtype)
+        if path is not None and os.path.exists(path) and os.path.getsize(path):
+            self.data = np.memmap(path, dtype=self.dtype, mode="r+")
+
+    def _grow(self, needed):
+        capacity = max(needed, len(self.data) + len(self.data) // 2)
+        capacity = -(-capacity // self.chunk_rows) * self.chunk_rows
+        if self.path is None:
+            data = np.empty(capacity, dtype=self.dtype)
+            data[:self.length] = self.data[:self.length]
+            self.data = data
+        else:
+            if isinstance(self.data, np.memmap):
+                self.data.flush()
+            with open(self.path, "ab") as f:
+                f.truncate(capacity * self.dtype.itemsize)
+            self.data = np.memmap(self.path, dtype=self.dtype, mode="r+")
+
+    def extend(self, values):
+        end = self.length + len(values)
+        if end > len(self.data):
+            self._grow(end)
+        self.data[self.length:end] = values
+        self.length = end
+
+    def view(self):
+        return self.data[:self.length]
+
+    def spill(self, path):
+        values = self.view().copy()
+        self.path = path
+        self.data = np.empty(0, dtype=self.dtype)
+        self.length = 0
+        if os.path.exists(path):
+            os.remove(path)
+        self.extend(values)
+
+    def flush(self):
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+
+class ResultStore:
+    """
+    Columnar store of scored reviews.
+
+    Labels are int8 codes (-1/0/1), neg/neu/pos/compound are float32 and each
+    review text is an int32 index into an interned text table, so a row
+    costs 21 bytes instead of a label string reference plus a scores dict.
+    Columns grow in `chunk_rows` steps. With `path` (or after spill(path))
+    every column lives in its own memory-mapped file `<path>.<column>` and
+    texts are appended to `<path>.texts`; `<path>.meta` records the row
+    count, so reopening the same path picks up where the last run stopped.
+    """
+
+    def __init__(self, path=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.texts = []
+        self.text_ids = {}
+        self.texts_file = None
+        length = 0
+        if path is not None and os.path.exists(path + ".meta"):
+            with open(path + ".meta", encoding="utf-8") as f:
+                length = json.load(f)['rows']
+            with open(path + ".texts", encoding="utf-8") as f:
+                for line in f:
+                    self._remember_text(json.loads(line))
+        self.columns = {name: Column(dtype, chunk_rows, self._column_path(name), length)
+                        for name, dtype in COLUMNS.items()}
+        if path is not None:
+            self.texts_file = open(path + ".texts", "a", encoding="utf-8")
+
+    def _column_path(self, name):
+        return None if self.path is None else f"{self.path}.{name}"
+
+    def _remember_text(self, text):
+        self.text_ids[text] = len(self.texts)
+        self.texts.append(text)
+
+    def intern(self, text):
+        if text is None:
+            return NO_TEXT
+        text_id = self.text_ids.get(text)
+        if text_id is None:
+            text_id = len(self.texts)
+            self._remember_text(text)
+            if self.texts_file is not None:
+                self.texts_file.write(json.dumps(text) + "\n")
+        return text_id
+
+    def extend(self, labels, scores, texts=None):
+        """
+        Appends a batch: `labels` as strings, `scores` as a structured array
+        with neg/neu/pos/compound fields (VaderBatchScorer.score_many output)
+        and optional review texts.
+        """
+        columns = self.columns
+        columns['label'].extend(np.fromiter((LABEL_CODES[label] for label in labels), dtype=np.int8, count=len(labels)))
+        for name in ('neg', 'neu', 'pos', 'compound'):
+            columns[name].extend(scores[name])
+        if texts is None:
+            columns['text_id'].extend(np.full(len(labels), NO_TEXT, dtype=np.int32))
+        else:
+            columns['text_id'].extend(np.fromiter((self.intern(text) for text in texts), dtype=np.int32,
+                                                count=len(labels)))
+
+    def append(self, label, scores, text=None):
+        """Appends one review; `scores` is a polarity_scores dict."""
+        row = np.array([(scores['neg'], scores['neu'], scores['pos'], scores['compound'])],
+                       dtype=[('neg', 'f8'), ('neu', 'f8'), ('pos', 'f8'), ('compound', 'f8')])
+        self.extend([label], row, None if text is None else [text])
+
+    def __len__(self):
+        return self.columns['label'].length
+
+    def column(self, name):
+        return self.columns[name].view()
+
+    def label(self, index):
+        return LABEL_NAMES[int(self.column('label')[index])]
+
+    def text(self, index):
+        text_id = int(self.column('text_id')[index])
+        return None if text_id == NO_TEXT else self.texts[text_id]
+
+    def counts(self):
+        codes = np.bincount(self.column('label').astype(np.intp) + 1, minlength=3)
+        return Counter({LABEL_NAMES[code - 1]: int(count) for code, count in enumerate(codes)})
+
+    def summary(self):
+        compound = self.column('compound').astype(np.float64)
+        total = len(compound)
+        return {'total': total, 'counts': self.counts(),
+                'compound_mean': float(compound.mean()) if total else 0.0,
+                'compound_stdev': float(compound.std(ddof=1)) if total > 1 else 0.0}
+
+    def spill(self, path):
+        """Moves an in-memory store to memory-mapped files under `path`."""
+        self.path = path
+        for name, column in self.columns.items():
+            column.spill(self._column_path(name))
+        with open(path + ".texts", "w", encoding="utf-8") as f:
+            for text in self.texts:
+                f.write(json.dumps(text) + "\n")
+        self.texts_file = open(path + ".texts", "a", encoding="utf-8")
+        self.flush()
+
+    def flush(self):
+        if self.path is None:
+            return
+        for column in self.columns.values():
+            column.flush()
+        if self.texts_file is not None:
+            self.texts_file.flush()
+        with open(self.path + ".meta", "w", encoding="utf-8") as f:
+            json.dump({'rows': len(self)}, f)
+
+    def close(self):
+        self.flush()
+        if self.texts_file is not None:
+            self.texts_file.close()
+            self.texts_file = None
+
+    def stats(self):
+        column_bytes = sum(len(self) * column.dtype.itemsize for column in self.columns.values())
+        return {'rows': len(self), 'texts': len(self.texts), 'column_bytes': column_bytes,
+                'mmap': self.path is not None}
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+    import tracemalloc
+
+    from bench_vader import synthetic_reviews
+
+    # One million scored reviews drawn from 50k distinct texts: the old list
+    # of label strings plus kept-score dicts vs. the columnar store.
+    rng = random.Random(11)
+    n_reviews = 1_000_000
+    texts = synthetic_reviews(50_000)
+    picked = rng.choices(texts, k=n_reviews)
+    compounds = [round(rng.uniform(-1, 1), 4) for _ in range(n_reviews)]
+    labels = ["Positive" if c >= 0.05 else "Negative" if c <= -0.05 else "Neutral" for c in compounds]
+    scores = np.zeros(n_reviews, dtype=[('neg', 'f8'), ('neu', 'f8'), ('pos', 'f8'), ('compound', 'f8')])
+    scores['compound'] = compounds
+    score_dicts = [dict(zip(scores.dtype.names, row)) for row in scores.tolist()]
+
+    tracemalloc.start()
+    history = list(labels)
+    kept = [(text, scores) for text, scores in zip(picked, score_dicts)]
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+
+    tracemalloc.start()
+    store = ResultStore()
+    for start in range(0, n_reviews, 10_000):
+        end = start + 10_000
+        store.extend(labels[start:end], scores[start:end], picked[start:end])
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    expected = Counter(history)
+    counter_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    counts = store.counts()
+    store_elapsed = time.perf_counter() - start
+
+    print("\n" + "=" * 60)
+    print(f"{'COLUMNAR RESULT STORE BENCHMARK':^60}")
+    print("=" * 60)
+    print(f"Reviews: {n_reviews:,} ({len(store.texts):,} distinct texts)")
+    print(f"  - list + score dicts  {list_bytes / 2**20:8.1f} MiB")
+    print(f"  - ResultStore         {store_bytes / 2**20:8.1f} MiB (columns {store.stats()['column_bytes'] / 2**20:.1f} MiB)")
+    print(f"  - Counter(history)    {counter_elapsed * 1e3:8.1f} ms")
+    print(f"  - store.counts()      {store_elapsed * 1e3:8.1f} ms  same counts: {counts == expected}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "results")
+        store.spill(path)
+        store.close()
+        reopened = ResultStore(path)
+        print(f"  - spilled to mmap, reopened {len(reopened):,} rows, same counts: {reopened.counts() == expected}, "
+              f"text[0] intact: {reopened.text(0) == picked[0]}")
+        reopened.close()
+    print("=" * 60)
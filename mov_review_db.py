@@ -0,0 +1,209 @@
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from mov_results import LABEL_CODES, LABEL_NAMES
+
+DEFAULT_REVIEW_DB_PATH = ".scored_reviews.sqlite"
+INSERT_BATCH_ROWS = 5000
+
+
+def text_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ReviewDatabase:
+    """
+    Persistent store of scored reviews (SQLite-backed).
+
+    Each row keeps the title ID, the review ID and date when known, a hash of
+    the raw text, the cleaned text, the VADER label and neg/neu/pos/compound.
+    Rows are written with executemany in batches inside one transaction, and
+    summaries come from GROUP BY queries over the (title_id, label) index, so
+    a title can be re-summarised without scraping or scoring it again.
+    """
+
+    def __init__(self, path=DEFAULT_REVIEW_DB_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(
+            "PRAGMA journal_mode = WAL;"
+            "CREATE TABLE IF NOT EXISTS reviews ("
+            " id INTEGER PRIMARY KEY, title_id TEXT NOT NULL, review_id TEXT, review_date TEXT,"
+            " text_hash TEXT NOT NULL, cleaned TEXT, label INTEGER NOT NULL,"
+            " neg REAL, neu REAL, pos REAL, compound REAL, scored_at REAL,"
+            " UNIQUE (title_id, review_id));"
+            "CREATE INDEX IF NOT EXISTS reviews_title ON reviews (title_id, label, compound);"
+            "CREATE INDEX IF NOT EXISTS reviews_date ON reviews (review_date);"
+            "CREATE INDEX IF NOT EXISTS reviews_hash ON reviews (text_hash);"
+        )
+        self.conn.commit()
+
+    def save_reviews(self, title_id, raw_texts, cleaned_texts, scores, labels, review_ids=None, dates=None,
+                     replace=False):
+        """
+        Stores one scored batch for a title. `scores` is a structured array
+        (or list of dicts) with neg/neu/pos/compound. Reviews with a known
+        review ID overwrite their earlier row; replace=True first drops every
+        stored row of the title (a full re-scrape).
+        """
+        now = time.time()
+        count = len(raw_texts)
+        review_ids = review_ids or [None] * count
+        dates = dates or [None] * count
+        rows = ((title_id, review_id, review_date, text_hash(raw), cleaned, LABEL_CODES[label],
+                 float(score['neg']), float(score['neu']), float(score['pos']), float(score['compound']), now)
+                for raw, cleaned, score, label, review_id, review_date
+                in zip(raw_texts, cleaned_texts, scores, labels, review_ids, dates))
+        with self.lock, self.conn:
+            if replace:
+                self.conn.execute("DELETE FROM reviews WHERE title_id = ?", (title_id,))
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= INSERT_BATCH_ROWS:
+                    self._insert(batch)
+                    batch = []
+            if batch:
+                self._insert(batch)
+        return count
+
+    def _insert(self, rows):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO reviews (title_id, review_id, review_date, text_hash, cleaned, label,"
+            " neg, neu, pos, compound, scored_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _where(self, title_id, since, until):
+        clauses, params = [], []
+        if title_id is not None:
+            clauses.append("title_id = ?")
+            params.append(title_id)
+        if since is not None:
+            clauses.append("review_date >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("review_date <= ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def summary(self, title_id=None, since=None, until=None):
+        """Label counts and compound mean / std dev from one aggregate query; `since`/`until` are ISO dates."""
+        where, params = self._where(title_id, since, until)
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT label, COUNT(*), SUM(compound), SUM(compound * compound) FROM reviews{where} GROUP BY label",
+                params).fetchall()
+        counts = Counter()
+        total, compound_sum, compound_sq_sum = 0, 0.0, 0.0
+        for label, count, label_sum, label_sq_sum in rows:
+            counts[LABEL_NAMES[label]] = count
+            total += count
+            compound_sum += label_sum or 0.0
+            compound_sq_sum += label_sq_sum or 0.0
+        mean = compound_sum / total if total else 0.0
+        variance = max(compound_sq_sum / total - mean * mean, 0.0) * total / (total - 1) if total > 1 else 0.0
+        return {'total': total, 'counts': counts, 'compound_mean': mean, 'compound_stdev': math.sqrt(variance)}
+
+    def counts(self, title_id=None, since=None, until=None):
+        return self.summary(title_id, since, until)['counts']
+
+    def for_title(self, title_id, since=None, until=None):
+        """A view with counts()/summary() that the summary printers accept in place of a history."""
+        return StoredTitle(self, title_id, since, until)
+
+    def titles(self):
+        """Per-title review count and mean compound, most reviewed first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT title_id, COUNT(*), AVG(compound) FROM reviews GROUP BY title_id ORDER BY COUNT(*) DESC"
+            ).fetchall()
+        return [{'title_id': title_id, 'reviews': count, 'compound_mean': mean} for title_id, count, mean in rows]
+
+    def stats(self):
+        with self.lock:
+            rows, titles = self.conn.execute("SELECT COUNT(*), COUNT(DISTINCT title_id) FROM reviews").fetchone()
+        return {'reviews': rows, 'titles': titles}
+
+    def close(self):
+        self.conn.close()
+
+
+class StoredTitle:
+    def __init__(self, database, title_id, since=None, until=None):
+        self.database = database
+        self.title_id = title_id
+        self.since = since
+        self.until = until
+
+    def summary(self):
+        return self.database.summary(self.title_id, self.since, self.until)
+
+    def counts(self):
+        return self.summary()['counts']
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+    from bench_vader import synthetic_reviews
+    from mov_normalize import normalize_reviews
+    from mov_labels import label_for_compound
+    from mov_vader import VaderBatchScorer
+
+    # 200 titles x 1,000 reviews: bulk insert speed, then re-summarising one
+    # title from the database vs. cleaning and scoring its reviews again.
+    rng = random.Random(21)
+    scorer = VaderBatchScorer(SentimentIntensityAnalyzer())
+    corpus = {f"tt{1000000 + i}": synthetic_reviews(1000, seed=i) for i in range(200)}
+    scored = {}
+    for title_id, reviews in corpus.items():
+        cleaned = normalize_reviews(reviews)
+        scores = scorer.score_many(cleaned)
+        scored[title_id] = (reviews, cleaned, scores, [label_for_compound(c) for c in scores['compound'].tolist()])
+
+    print("\n" + "=" * 60)
+    print(f"{'SCORED REVIEW DATABASE BENCHMARK':^60}")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        single = sqlite3.connect(os.path.join(tmp_dir, "single.sqlite"))
+        single.execute("CREATE TABLE reviews (title_id TEXT, text_hash TEXT, cleaned TEXT, label INTEGER,"
+                       " neg REAL, neu REAL, pos REAL, compound REAL)")
+        reviews, cleaned, scores, labels = scored["tt1000000"]
+        start = time.perf_counter()
+        for raw, text, score, label in zip(reviews, cleaned, scores.tolist(), labels):
+            single.execute("INSERT INTO reviews VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           ("tt1000000", text_hash(raw), text, LABEL_CODES[label], *score))
+            single.commit()
+        single_rate = len(reviews) / (time.perf_counter() - start)
+        single.close()
+
+        database = ReviewDatabase(os.path.join(tmp_dir, "reviews.sqlite"))
+        start = time.perf_counter()
+        for title_id, (reviews, cleaned, scores, labels) in scored.items():
+            database.save_reviews(title_id, reviews, cleaned, scores, labels)
+        bulk_elapsed = time.perf_counter() - start
+        total = database.stats()['reviews']
+        print(f"  - row-by-row insert + commit  {single_rate:>10,.0f} rows/s")
+        print(f"  - save_reviews (executemany)  {total / bulk_elapsed:>10,.0f} rows/s  ({total:,} rows)")
+
+        title_id = rng.choice(list(corpus))
+        start = time.perf_counter()
+        for _ in range(20):
+            summary = database.summary(title_id)
+        query_elapsed = (time.perf_counter() - start) / 20
+        start = time.perf_counter()
+        compounds = scorer.score_many(normalize_reviews(corpus[title_id]))['compound'].tolist()
+        rescored = Counter(label_for_compound(compound) for compound in compounds)
+        rescore_elapsed = time.perf_counter() - start
+        print(f"  - summary query for {title_id}  {query_elapsed * 1e3:8.2f} ms")
+        print(f"  - clean + rescore {title_id}    {rescore_elapsed * 1e3:8.2f} ms  same counts: {summary['counts'] == rescored}")
+        database.close()
+    print("=" * 60)
@@ -0,0 +1,206 @@
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from mov_vader import SCORE_DTYPE
+
+DEFAULT_SCORE_CACHE_PATH = ".score_cache.sqlite"
+# Rough per-entry cost of an OrderedDict slot (hash table entry plus linked-list node).
+ENTRY_OVERHEAD = 100
+
+
+def entry_size(key, scores):
+    return sys.getsizeof(key) + sys.getsizeof(scores) + sum(map(sys.getsizeof, scores)) + ENTRY_OVERHEAD
+
+
+class ScoreCache:
+    """
+    Bounded LRU cache of VADER scores in front of a VaderBatchScorer.
+
+    Keys are preprocessed review texts; with casefold=True "Masterpiece" and
+    "MASTERPIECE" share an entry, trading VADER's ALL CAPS emphasis for a higher
+    hit rate. When `path` is set, scores also go to a SQLite table that
+    survives across runs and is consulted on memory misses. All methods are
+    safe to call from several threads.
+    """
+
+    def __init__(self, scorer, max_entries=100_000, casefold=False, path=None):
+        self.scorer = scorer
+        self.max_entries = max_entries
+        self.casefold = casefold
+        self.entries = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = None
+        self.table = "scores_casefold" if casefold else "scores"
+        if path is not None:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                " text TEXT PRIMARY KEY, neg REAL, neu REAL, pos REAL, compound REAL, stored_at REAL)"
+            )
+            self.conn.commit()
+
+    def key(self, text):
+        return text.casefold() if self.casefold else text
+
+    def _remember(self, key, scores):
+        # Caller holds the lock.
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = scores
+        self.memory_bytes += entry_size(key, scores)
+        while len(self.entries) > self.max_entries:
+            self.memory_bytes -= entry_size(*self.entries.popitem(last=False))
+
+    def _load(self, keys):
+        # Caller holds the lock.
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT text, neg, neu, pos, compound FROM {self.table} WHERE text IN ({placeholders})",
+                batch).fetchall()
+            found.update((row[0], tuple(row[1:])) for row in rows)
+        return found
+
+    def lookup_many(self, keys):
+        """Returns {key: scores} for the keys found in memory or on disk; counts hits and misses."""
+        found = {}
+        with self.lock:
+            for key in keys:
+                scores = self.entries.get(key)
+                if scores is not None:
+                    self.entries.move_to_end(key)
+                    found[key] = scores
+            self.hits += len(found)
+            remaining = [key for key in keys if key not in found]
+            if remaining and self.conn is not None:
+                from_disk = self._load(remaining)
+                for key, scores in from_disk.items():
+                    self._remember(key, scores)
+                found.update(from_disk)
+                self.disk_hits += len(from_disk)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def store_many(self, scored):
+        """Adds {key: scores} to memory and, when enabled, to the on-disk tier."""
+        with self.lock:
+            for key, scores in scored.items():
+                self._remember(key, scores)
+            if self.conn is not None and scored:
+                now = time.time()
+                with self.conn:
+                    self.conn.executemany(
+                        f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?, ?)",
+                        [(key, *scores, now) for key, scores in scored.items()])
+
+    def score_tuple(self, text):
+        key = self.key(text)
+        scores = self.lookup_many([key]).get(key)
+        if scores is None:
+            scores = self.scorer.score_tuple(text)
+            self.store_many({key: scores})
+        return scores
+
+    def polarity_scores(self, text):
+        return dict(zip(SCORE_DTYPE.names, self.score_tuple(text)))
+
+    def score_many(self, texts):
+        """Same result as VaderBatchScorer.score_many, scoring only texts not already cached."""
+        texts = list(texts)
+        keys = [self.key(text) for text in texts]
+        distinct = list(dict.fromkeys(keys))
+        found = self.lookup_many(distinct)
+        with self.lock:
+            # Repeats inside the batch are served from the first copy's result.
+            self.hits += len(keys) - len(distinct)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            computed = self.scorer.score_many(list(missing.values())).tolist()
+            scored = dict(zip(missing, computed))
+            self.store_many(scored)
+            found.update(scored)
+
+        results = np.empty(len(texts), dtype=SCORE_DTYPE)
+        for index, key in enumerate(keys):
+            results[index] = found[key]
+        return results
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            stats = {'entries': len(self.entries), 'hits': self.hits, 'disk_hits': self.disk_hits,
+                     'misses': self.misses, 'hit_rate': round((self.hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+                     'memory_bytes': self.memory_bytes}
+            if self.conn is not None:
+                stats['disk_entries'] = self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        return stats
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+    from bench_vader import synthetic_reviews
+    from mov_vader import VaderBatchScorer
+
+    # Scraped titles repeat heavily, so draw 200k reviews from 20k distinct
+    # titles with a Zipf-like skew, fed in batches of 1,000 (one results page).
+    rng = random.Random(3)
+    titles = synthetic_reviews(20_000)
+    weights = [1 / (rank + 1) for rank in range(len(titles))]
+    reviews = rng.choices(titles, weights=weights, k=200_000)
+    batches = [reviews[start:start + 1000] for start in range(0, len(reviews), 1000)]
+    sid = SentimentIntensityAnalyzer()
+
+    def run(scorer):
+        start = time.perf_counter()
+        results = [scorer.score_many(batch) for batch in batches]
+        return time.perf_counter() - start, np.concatenate(results)
+
+    print("\n" + "=" * 60)
+    print(f"{'SCORE CACHE BENCHMARK':^60}")
+    print("=" * 60)
+    print(f"Reviews: {len(reviews):,} drawn from {len(titles):,} titles, batches of 1,000")
+    baseline_elapsed, expected = run(VaderBatchScorer(sid))
+    print(f"  - no cache        {len(reviews) / baseline_elapsed:>10,.0f} reviews/s")
+    for max_entries in (1_000, 10_000, 100_000):
+        cache = ScoreCache(VaderBatchScorer(sid), max_entries=max_entries)
+        elapsed, results = run(cache)
+        stats = cache.stats()
+        print(f"  - LRU {max_entries:>7,}     {len(reviews) / elapsed:>10,.0f} reviews/s  hit rate {stats['hit_rate']:.1%}  "
+              f"{stats['memory_bytes'] / 2**20:5.1f} MiB  identical: {bool((results == expected).all())}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "scores.sqlite")
+        ScoreCache(VaderBatchScorer(sid), path=path).score_many(titles)
+        cache = ScoreCache(VaderBatchScorer(sid), path=path)
+        elapsed, results = run(cache)
+        stats = cache.stats()
+        print(f"  - warm disk tier  {len(reviews) / elapsed:>10,.0f} reviews/s  disk hits {stats['disk_hits']:,}  "
+              f"misses {stats['misses']:,}  identical: {bool((results == expected).all())}")
+        cache.close()
+    print("=" * 60)
@@ -0,0 +1,292 @@
+import asyncio
+import json
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from mov_normalize import normalize_reviews
+from mov_cli import flag_value, non_negative_float, port_number, positive_int
+from mov_labels import label_for_compound
+from mov_vader import VaderBatchScorer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT = 0.005
+LATENCY_SAMPLES = 10_000
+MAX_BODY_BYTES = 1 << 20
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+USAGE = "Usage: python mov_service.py [--port 8765] [--max-batch 64] [--max-wait-ms 5]"
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(fraction * len(sorted_values)), len(sorted_values) - 1)]
+
+
+def batch_bucket(size):
+    """Power-of-two histogram bucket: 1, 2, 4, 8, ... (a batch of 5-8 texts lands in 8)."""
+    bucket = 1
+    while bucket < size:
+        bucket *= 2
+    return bucket
+
+
+class ServiceStats:
+    """Request latency and queue wait (last LATENCY_SAMPLES requests) plus batch-size counts."""
+
+    def __init__(self, max_samples=LATENCY_SAMPLES):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.texts = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_texts = 0
+        self.score_seconds = 0.0
+        self.latencies = deque(maxlen=max_samples)
+        self.queue_waits = deque(maxlen=max_samples)
+        self.batch_sizes = Counter()
+
+    def record_batch(self, size, seconds):
+        self.batches += 1
+        self.batched_texts += size
+        self.score_seconds += seconds
+        self.batch_sizes[batch_bucket(size)] += 1
+
+    def record_request(self, texts, latency, queue_wait=None):
+        self.requests += 1
+        self.texts += texts
+        self.latencies.append(latency)
+        if queue_wait is not None:
+            self.queue_waits.append(queue_wait)
+
+    def as_dict(self):
+        latencies = sorted(self.latencies)
+        queue_waits = sorted(self.queue_waits)
+        return {
+            'requests': self.requests, 'texts': self.texts, 'errors': self.errors, 'batches': self.batches,
+            'uptime_seconds': round(time.monotonic() - self.started, 1),
+            'latency_ms': {name: round(percentile(latencies, fraction) * 1e3, 3)
+                           for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0))},
+            'queue_wait_ms': {name: round(percentile(queue_waits, fraction) * 1e3, 3)
+                              for name, fraction in (('p50', 0.5), ('p99', 0.99))},
+            'mean_batch_size': round(self.batched_texts / self.batches, 2) if self.batches else 0.0,
+            'score_ms_per_batch': round(self.score_seconds / self.batches * 1e3, 3) if self.batches else 0.0,
+            'batch_size_histogram': {f"<={bucket}": count for bucket, count in sorted(self.batch_sizes.items())},
+        }
+
+
+class MicroBatcher:
+    """
+    Collects texts from concurrent requests into micro-batches.
+
+    A batch closes once it holds `max_batch_size` texts or `max_wait` seconds
+    after its first request arrived, whichever comes first. It is then cleaned
+    and scored with one score_many call on `executor`, so the event loop keeps
+    accepting requests meanwhile. Batches are scored one after another: while
+    one is in the executor the next one fills up, which makes batches grow
+    with load instead of queueing single-text calls.
+    """
+
+    def __init__(self, scorer=None, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT,
+                 executor=None, stats=None):
+        self.scorer = scorer or VaderBatchScorer()
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="scorer")
+        self.stats = stats or ServiceStats()
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        self.executor.shutdown(wait=True)
+
+    async def score(self, texts):
+        """Scores a list of raw texts; returns ([(neg, neu, pos, compound), ...], seconds spent queued)."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((texts, future, time.perf_counter()))
+        return await future
+
+    def _score_batch(self, texts):
+        return self.scorer.score_many(normalize_reviews(texts)).tolist()
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        item = await self.queue.get()
+        batch = [item]
+        size = len(item[0])
+        deadline = loop.time() + self.max_wait
+        while size < self.max_batch_size:
+            if self.queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self.queue.get_nowait()
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            texts = [text for item_texts, _, _ in batch for text in item_texts]
+            start = time.perf_counter()
+            try:
+                rows = await loop.run_in_executor(self.executor, self._score_batch, texts)
+            except Exception as err:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(err)
+                continue
+            self.stats.record_batch(len(texts), time.perf_counter() - start)
+            offset = 0
+            for item_texts, future, queued in batch:
+                if not future.done():
+                    future.set_result((rows[offset:offset + len(item_texts)], start - queued))
+                offset += len(item_texts)
+
+
+def result_for(row):
+    neg, neu, pos, compound = row
+    return {'label': label_for_compound(compound), 'compound': compound, 'neg': neg, 'neu': neu, 'pos': pos}
+
+
+class ScoringService:
+    """
+    Local HTTP/JSON front end for the preprocess + VADER scoring path.
+
+    POST /score with {"text": "..."} returns one result, with {"texts": [...]}
+    a {"results": [...]} list; each result has label, compound, neg, neu and pos,
+    computed like mov_nlp_v5 (normalize_review, then polarity scores).
+    GET /stats returns latency percentiles, queue wait and the batch-size
+    histogram; GET /health returns {"status": "ok"}. Connections are kept
+    alive between requests unless the client sends "Connection: close".
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                 max_wait=DEFAULT_MAX_WAIT, scorer=None):
+        self.host = host
+        self.port = port
+        self.stats = ServiceStats()
+        self.batcher = MicroBatcher(scorer, max_batch_size, max_wait, stats=self.stats)
+        self.server = None
+
+    async def start(self):
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.batcher.stop()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': "request body too large"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self._route(method, path.split("?", 1)[0], body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, payload, keep_alive=True):
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                     .encode("latin-1") + body)
+        await writer.drain()
+
+    async def _route(self, method, path, body):
+        if path == "/health":
+            return 200, {'status': "ok"}
+        if path == "/stats":
+            return 200, self.stats.as_dict()
+        if path != "/score":
+            return 404, {'error': f"unknown path {path}"}
+        if method != "POST":
+            return 405, {'error': "use POST /score"}
+
+        start = time.perf_counter()
+        try:
+            request = json.loads(body)
+            texts = [request['text']] if 'text' in request else request['texts']
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise TypeError
+        except (ValueError, TypeError, KeyError):
+            self.stats.errors += 1
+            return 400, {'error': 'expected {"text": "..."} or {"texts": ["...", ...]}'}
+        if not texts:
+            return 200, {'results': []}
+        try:
+            rows, queue_wait = await self.batcher.score(texts)
+        except Exception as err:
+            self.stats.errors += 1
+            return 500, {'error': str(err)}
+        self.stats.record_request(len(texts), time.perf_counter() - start, queue_wait)
+        results = [result_for(row) for row in rows]
+        return 200, results[0] if 'text' in request else {'results': results}
+
+
+async def serve(host, port, max_batch_size, max_wait):
+    service = await ScoringService(host, port, max_batch_size, max_wait).start()
+    print(f"Scoring service on http://{host}:{service.port} "
+          f"(max batch {max_batch_size}, max wait {max_wait * 1e3:.1f} ms)")
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    port = flag_value(sys.argv, "--port", port_number, DEFAULT_PORT, usage=USAGE)
+    max_batch_size = flag_value(sys.argv, "--max-batch", positive_int, DEFAULT_MAX_BATCH_SIZE, usage=USAGE)
+    max_wait = flag_value(sys.argv, "--max-wait-ms", non_negative_float, DEFAULT_MAX_WAIT * 1e3, usage=USAGE) / 1e3
+    try:
+        asyncio.run(serve(DEFAULT_HOST, port, max_batch_size, max_wait))
+    except KeyboardInterrupt:
+        print("Scoring service stopped.")
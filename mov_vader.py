@@ -0,0 +1,249 @@
+import math
+import string
+
+import numpy as np
+
+from mov_lexicon import load_vader_tables, tables_from_analyzer
+
+SCORE_DTYPE = np.dtype([('neg', 'f8'), ('neu', 'f8'), ('pos', 'f8'), ('compound', 'f8')])
+PUNCTUATION = string.punctuation
+STRIP_PUNCTUATION = str.maketrans('', '', PUNCTUATION)
+DEFAULT_MAX_CACHED_TOKENS = 200_000
+
+
+class VaderBatchScorer:
+    """
+    Batch front end for NLTK's VADER that returns exactly what
+    SentimentIntensityAnalyzer.polarity_scores returns, text for text.
+
+    The lexicon, booster, negation and idiom tables are taken once from the
+    analyzer into flat lookup structures, every distinct token is classified
+    once (lowercase form, ALL CAPS flag, valence, booster scalar, negation) and
+    reused across the whole batch, and repeated texts in a batch are scored once.
+    The token cache is emptied once it holds `max_cached_tokens` tokens, so a
+    long-running scorer (mov_service) does not grow with every new word it sees.
+    Without an analyzer the tables come from the cached binary lexicon
+    (mov_lexicon), which avoids importing nltk at all.
+    """
+
+    def __init__(self, analyzer=None, tables=None, max_cached_tokens=DEFAULT_MAX_CACHED_TOKENS):
+        if tables is None:
+            tables = tables_from_analyzer(analyzer) if analyzer is not None else load_vader_tables()
+        self.analyzer = analyzer
+        self.lexicon = tables['lexicon']
+        self.booster = dict(tables['booster'])
+        self.idioms = dict(tables['idioms'])
+        self.negate = frozenset(tables['negate'])
+        self.punc_list = frozenset(tables['punc_list'])
+        self.c_incr = tables['c_incr']
+        self.b_decr = tables['b_decr']
+        self.n_scalar = tables['n_scalar']
+        self.least_in_lexicon = "least" in self.lexicon
+        self.max_cached_tokens = max_cached_tokens
+        self.token_info = {}
+
+    def _info(self, token):
+        # (lowercase, is ALL CAPS, lexicon valence or None, booster scalar or None, negation word)
+        info = self.token_info.get(token)
+        if info is None:
+            lower = token.lower()
+            info = (lower, token.isupper(), self.lexicon.get(lower), self.booster.get(lower),
+                    lower in self.negate or "n't" in lower)
+            if len(self.token_info) >= self.max_cached_tokens:
+                self.token_info.clear()
+            self.token_info[token] = info
+        return info
+
+    def tokenize(self, text):
+        """Same tokens as nltk's SentiText.words_and_emoticons, without building its punctuation product dict."""
+        words_only = {word for word in text.translate(STRIP_PUNCTUATION).split() if len(word) > 1}
+        tokens = []
+        for token in text.split():
+            if len(token) <= 1:
+                continue
+            core = token.rstrip(PUNCTUATION)
+            if core != token:
+                if token[len(core):] in self.punc_list and core in words_only:
+                    token = core
+            else:
+                core = token.lstrip(PUNCTUATION)
+                if core != token and token[:len(token) - len(core)] in self.punc_list and core in words_only:
+                    token = core
+            tokens.append(token)
+        return tokens
+
+    def _scalar_inc_dec(self, info, valence, is_cap_diff):
+        scalar = info[3]
+        if scalar is None:
+            return 0.0
+        if valence < 0:
+            scalar *= -1
+        if info[1] and is_cap_diff:
+            if valence > 0:
+                scalar += self.c_incr
+            else:
+                scalar -= self.c_incr
+        return scalar
+
+    def _idioms_check(self, valence, tokens, i):
+        idioms = self.idioms
+        onezero = f"{tokens[i - 1]} {tokens[i]}"
+        twoonezero = f"{tokens[i - 2]} {tokens[i - 1]} {tokens[i]}"
+        twoone = f"{tokens[i - 2]} {tokens[i - 1]}"
+        threetwoone = f"{tokens[i - 3]} {tokens[i - 2]} {tokens[i - 1]}"
+        threetwo = f"{tokens[i - 3]} {tokens[i - 2]}"
+        for sequence in (onezero, twoonezero, twoone, threetwoone, threetwo):
+            if sequence in idioms:
+                valence = idioms[sequence]
+                break
+        if len(tokens) - 1 > i:
+            zeroone = f"{tokens[i]} {tokens[i + 1]}"
+            if zeroone in idioms:
+                valence = idioms[zeroone]
+        if len(tokens) - 1 > i + 1:
+            zeroonetwo = f"{tokens[i]} {tokens[i + 1]} {tokens[i + 2]}"
+            if zeroonetwo in idioms:
+                valence = idioms[zeroonetwo]
+        if threetwo in self.booster or twoone in self.booster:
+            valence = valence + self.b_decr
+        return valence
+
+    def _never_check(self, valence, tokens, infos, start_i, i):
+        if start_i == 0:
+            if infos[i - 1][4]:
+                valence = valence * self.n_scalar
+        elif start_i == 1:
+            if tokens[i - 2] == "never" and (tokens[i - 1] == "so" or tokens[i - 1] == "this"):
+                valence = valence * 1.5
+            elif infos[i - 2][4]:
+                valence = valence * self.n_scalar
+        else:
+            if (tokens[i - 3] == "never" and (tokens[i - 2] == "so" or tokens[i - 2] == "this")
+                    or (tokens[i - 1] == "so" or tokens[i - 1] == "this")):
+                valence = valence * 1.25
+            elif infos[i - 3][4]:
+                valence = valence * self.n_scalar
+        return valence
+
+    def _least_check(self, valence, infos, i):
+        if self.least_in_lexicon:
+            return valence
+        if i > 1 and infos[i - 1][0] == "least":
+            if infos[i - 2][0] != "at" and infos[i - 2][0] != "very":
+                valence = valence * self.n_scalar
+        elif i > 0 and infos[i - 1][0] == "least":
+            valence = valence * self.n_scalar
+        return valence
+
+    def _sentiments(self, tokens):
+        infos = [self._info(token) for token in tokens]
+        count = len(tokens)
+        allcap_words = sum(1 for info in infos if info[1])
+        is_cap_diff = 0 < count - allcap_words < count
+
+        first_index = {}
+        for index, token in enumerate(tokens):
+            if token not in first_index:
+                first_index[token] = index
+
+        sentiments = []
+        for item in tokens:
+            i = first_index[item]
+            lower, is_upper, lexicon_valence, booster, _ = infos[i]
+            if (i < count - 1 and lower == "kind" and infos[i + 1][0] == "of") or booster is not None:
+                sentiments.append(0)
+                continue
+
+            valence = 0
+            if lexicon_valence is not None:
+                valence = lexicon_valence
+                if is_upper and is_cap_diff:
+                    if valence > 0:
+                        valence += self.c_incr
+                    else:
+                        valence -= self.c_incr
+
+                for start_i in range(0, 3):
+                    if i > start_i and infos[i - (start_i + 1)][2] is None:
+                        s = self._scalar_inc_dec(infos[i - (start_i + 1)], valence, is_cap_diff)
+                        if start_i == 1 and s != 0:
+                            s = s * 0.95
+                        if start_i == 2 and s != 0:
+                            s = s * 0.9
+                        valence = valence + s
+                        valence = self._never_check(valence, tokens, infos, start_i, i)
+                        if start_i == 2:
+                            valence = self._idioms_check(valence, tokens, i)
+
+                valence = self._least_check(valence, infos, i)
+            sentiments.append(valence)
+
+        lowers = [info[0] for info in infos]
+        if "but" in lowers:
+            bi = lowers.index("but")
+            for sidx, sentiment in enumerate(sentiments):
+                if sidx < bi:
+                    sentiments[sidx] = sentiment * 0.5
+                elif sidx > bi:
+                    sentiments[sidx] = sentiment * 1.5
+        return sentiments
+
+    def _score_valence(self, sentiments, text):
+        if not sentiments:
+            return (0.0, 0.0, 0.0, 0.0)
+
+        sum_s = float(sum(sentiments))
+        ep_count = min(text.count("!"), 4)
+        qm_count = text.count("?")
+        qm_amplifier = 0
+        if qm_count > 1:
+            qm_amplifier = qm_count * 0.18 if qm_count <= 3 else 0.96
+        punct_emph_amplifier = ep_count * 0.292 + qm_amplifier
+        if sum_s > 0:
+            sum_s += punct_emph_amplifier
+        elif sum_s < 0:
+            sum_s -= punct_emph_amplifier
+        compound = sum_s / math.sqrt((sum_s * sum_s) + 15)
+
+        pos_sum = 0.0
+        neg_sum = 0.0
+        neu_count = 0
+        for sentiment in sentiments:
+            if sentiment > 0:
+                pos_sum += float(sentiment) + 1
+            if sentiment < 0:
+                neg_sum += float(sentiment) - 1
+            if sentiment == 0:
+                neu_count += 1
+
+        if pos_sum > math.fabs(neg_sum):
+            pos_sum += punct_emph_amplifier
+        elif pos_sum < math.fabs(neg_sum):
+            neg_sum -= punct_emph_amplifier
+
+        total = pos_sum + math.fabs(neg_sum) + neu_count
+        return (round(math.fabs(neg_sum / total), 3), round(math.fabs(neu_count / total), 3),
+                round(math.fabs(pos_sum / total), 3), round(compound, 4))
+
+    def score_tuple(self, text):
+        """Returns (neg, neu, pos, compound) for one text."""
+        if not isinstance(text, str):
+            text = str(text.encode("utf-8"))
+        return self._score_valence(self._sentiments(self.tokenize(text)), text)
+
+    def polarity_scores(self, text):
+        """Drop-in replacement for SentimentIntensityAnalyzer.polarity_scores."""
+        return dict(zip(SCORE_DTYPE.names, self.score_tuple(text)))
+
+    def score_many(self, texts):
+        """Scores a sequence of texts and returns a NumPy structured array with neg/neu/pos/compound fields."""
+        texts = list(texts)
+        results = np.empty(len(texts), dtype=SCORE_DTYPE)
+        seen = {}
+        for index, text in enumerate(texts):
+            scores = seen.get(text)
+            if scores is None:
+                scores = seen[text] = self.score_tuple(text)
+            results[index] = scores
+        return results
+
@@ -0,0 +1,124 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_WATERMARK_PATH = ".review_watermarks.sqlite"
+TITLE_ID_RE = re.compile(r'/title/(tt\d+)')
+
+
+def title_id_from_url(url):
+    match = TITLE_ID_RE.search(url)
+    return match.group(1) if match else url
+
+
+class WatermarkStore:
+    """
+    Per-title record of already-scraped reviews (SQLite-backed).
+
+    Keeps the seen review IDs and the newest review date for each title, so a
+    refresh can stop paginating once it reaches reviews from an earlier run,
+    plus a pagination checkpoint so an interrupted scrape resumes where it stopped.
+    The checkpoint also holds the reviews loaded so far: they are marked
+    seen as their page is read, so until the caller has scored them and
+    calls clear_checkpoint() the checkpoint is the only copy.
+    """
+
+    def __init__(self, path=DEFAULT_WATERMARK_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS seen_reviews ("
+            " title_id TEXT, review_id TEXT, review_date TEXT, PRIMARY KEY (title_id, review_id));"
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            " title_id TEXT PRIMARY KEY, newest_date TEXT, updated_at REAL);"
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            " title_id TEXT PRIMARY KEY, next_url TEXT, loaded INTEGER, updated_at REAL, reviews TEXT);"
+        )
+        self.conn.commit()
+
+    def newest_date(self, title_id):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT newest_date FROM watermarks WHERE title_id = ?", (title_id,)).fetchone()
+        return row[0] if row else None
+
+    def seen_ids(self, title_id, review_ids):
+        """Returns the subset of review_ids already recorded for title_id."""
+        review_ids = [review_id for review_id in review_ids if review_id]
+        if not review_ids:
+            return set()
+        placeholders = ",".join("?" * len(review_ids))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT review_id FROM seen_reviews WHERE title_id = ? AND review_id IN ({placeholders})",
+                (title_id, *review_ids)).fetchall()
+        return {row[0] for row in rows}
+
+    def filter_new(self, title_id, reviews):
+        """
+        Drops reviews from an earlier run: those whose ID was already seen, or,
+        when a review has no ID, whose date is older than the title's watermark.
+        """
+        seen = self.seen_ids(title_id, [review.get('review_id') for review in reviews])
+        newest = self.newest_date(title_id)
+        new_reviews = []
+        for review in reviews:
+            review_id = review.get('review_id')
+            if review_id:
+                if review_id in seen:
+                    continue
+            elif newest and review.get('date') and review['date'] < newest:
+                continue
+            new_reviews.append(review)
+        return new_reviews
+
+    def commit_page(self, title_id, reviews, next_url=None, loaded=0, pending=None):
+        """
+        Atomically records a page's reviews as seen, advances the newest-date
+        watermark and stores the checkpoint: the next page to fetch and the
+        reviews loaded so far ({'review_id', 'title', 'date'} dicts). With
+        neither (next_url and pending both None) the checkpoint is cleared.
+        """
+        now = time.time()
+        dates = [review['date'] for review in reviews if review.get('date')]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen_reviews VALUES (?, ?, ?)",
+                [(title_id, review['review_id'], review.get('date')) for review in reviews if review.get('review_id')])
+            if dates:
+                self.conn.execute(
+                    "INSERT INTO watermarks VALUES (?, ?, ?) ON CONFLICT(title_id) DO UPDATE SET"
+                    " newest_date = MAX(COALESCE(newest_date, ''), excluded.newest_date), updated_at = excluded.updated_at",
+                    (title_id, max(dates), now))
+            if next_url is None and pending is None:
+                self.conn.execute("DELETE FROM checkpoints WHERE title_id = ?", (title_id,))
+            else:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (title_id, next_url, loaded, updated_at, reviews)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (title_id, next_url, loaded, now, None if pending is None else json.dumps(pending)))
+
+    def load_checkpoint(self, title_id):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT next_url, loaded, reviews FROM checkpoints WHERE title_id = ?", (title_id,)).fetchone()
+        if not row:
+            return None
+        return {'next_url': row[0], 'loaded': row[1], 'reviews': json.loads(row[2]) if row[2] else []}
+
+    def clear_checkpoint(self, title_id):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM checkpoints WHERE title_id = ?", (title_id,))
+
+    def stats(self, title_id):
+        with self.lock:
+            seen = self.conn.execute(
+                "SELECT COUNT(*) FROM seen_reviews WHERE title_id = ?", (title_id,)).fetchone()[0]
+        return {'seen': seen, 'newest_date': self.newest_date(title_id),
+                'checkpoint': self.load_checkpoint(title_id)}
+
+    def close(self):
+        self.conn.close()